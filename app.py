@@ -293,9 +293,9 @@ class MainWindow(QMainWindow):
     
     def _add_fixtures(self, fixtures: List[Dict[str, Any]]):
         """Add imported fixtures to the project."""
-        # Validate fixtures before adding
+        # Validate fixtures before adding (check each fixture, not the whole project per fixture)
         for fixture in fixtures:
-            if not self.validate_fixture_data():
+            if not core.ensure_fixture_role_consistency([fixture]):
                 print(f"Warning: Fixture {fixture.get('name', 'Unknown')} has invalid role")
         
         self.project_state['fixtures'].extend(fixtures)
@@ -310,77 +310,62 @@ class MainWindow(QMainWindow):
             sequence_start = self.config.get_sequence_start_number()
             core.assign_sequences(matched_ma_fixtures, sequence_start)
         
-        self._update_fixtures_tables()
-        self._update_status_info()
-        self._update_ui_state()
+        self._refresh_views()
         
         count = len(fixtures)
         self.status_label.setText(f"Imported {count} fixture{'s' if count != 1 else ''}")
     
+    def _refresh_views(self):
+        """Refresh tables, status text and button state from one statistics pass."""
+        self._update_fixtures_tables()
+        stats = self.get_fixture_statistics()
+        self._update_status_info(stats)
+        self._update_ui_state(stats)
+    
     def _update_fixtures_tables(self):
         """Update both ma and remote fixtures tables."""
-        self._update_ma_table()
-        self._update_remote_table()
-    
-    def _update_ma_table(self):
-        """Update the ma fixtures table display."""
-        # Get ma fixtures using centralized access method
-        ma_fixtures = self.get_ma_fixtures()
-        
-        # Update the fixture grouping table
-        self.ma_table.setFixtures(ma_fixtures)
-
-    def _update_remote_table(self):
-        """Update the remote fixtures table display."""
-        # Get remote fixtures using centralized access method
-        remote_fixtures = self.get_remote_fixtures()
-        
-        # Update the fixture grouping table
-        self.remote_table.setFixtures(remote_fixtures)
+        # Split the fixtures by role once for both tables
+        partitions = core.partition_fixtures_by_role(self.project_state['fixtures'])
+        self.ma_table.setFixtures(partitions['ma'])
+        self.remote_table.setFixtures(partitions['remote'])
     
     def _on_ma_fixture_order_changed(self, new_order):
         """Handle when ma fixture order changes."""
-        # Update the project state with the new fixture order
-        ma_fixtures = self.get_ma_fixtures()
-        fixture_map = {fixture.get('fixture_id'): fixture for fixture in ma_fixtures}
-        
-        # Reorder fixtures based on new order
-        reordered_fixtures = []
-        for fixture_id in new_order:
-            if fixture_id in fixture_map:
-                reordered_fixtures.append(fixture_map[fixture_id])
-        
-        # Update the project state
-        all_fixtures = self.project_state['fixtures']
-        remote_fixtures = self.get_remote_fixtures()
-        
-        # Replace ma fixtures with reordered ones
-        self.project_state['fixtures'] = reordered_fixtures + remote_fixtures
+        self._reorder_role_fixtures('ma', new_order)
         
         # Update status
         self.status_label.setText(f"Ma fixture order updated")
     
     def _on_remote_fixture_order_changed(self, new_order):
         """Handle when remote fixture order changes."""
-        # Update the project state with the new fixture order
-        remote_fixtures = self.get_remote_fixtures()
-        fixture_map = {fixture.get('fixture_id'): fixture for fixture in remote_fixtures}
-        
-        # Reorder fixtures based on new order
-        reordered_fixtures = []
-        for fixture_id in new_order:
-            if fixture_id in fixture_map:
-                reordered_fixtures.append(fixture_map[fixture_id])
-        
-        # Update the project state
-        ma_fixtures = self.get_ma_fixtures()
-        
-        # Replace remote fixtures with reordered ones
-        self.project_state['fixtures'] = ma_fixtures + reordered_fixtures
+        self._reorder_role_fixtures('remote', new_order)
         
         # Update status
         self.status_label.setText(f"Remote fixture order updated")
     
+    def _reorder_role_fixtures(self, role: str, new_order: List[int]):
+        """Update the project state with a new fixture order for one role."""
+        # Split ma and remote fixtures in a single pass over the project
+        ma_fixtures = []
+        remote_fixtures = []
+        for fixture in self.project_state['fixtures']:
+            fixture_role = core.get_fixture_role(fixture)
+            if fixture_role == 'ma':
+                ma_fixtures.append(fixture)
+            elif fixture_role == 'remote':
+                remote_fixtures.append(fixture)
+        
+        # Reorder fixtures based on new order
+        role_fixtures = ma_fixtures if role == 'ma' else remote_fixtures
+        fixture_map = {fixture.get('fixture_id'): fixture for fixture in role_fixtures}
+        reordered_fixtures = [fixture_map[fixture_id] for fixture_id in new_order if fixture_id in fixture_map]
+        
+        # Replace this role's fixtures with reordered ones, keeping ma before remote
+        if role == 'ma':
+            self.project_state['fixtures'] = reordered_fixtures + remote_fixtures
+        else:
+            self.project_state['fixtures'] = ma_fixtures + reordered_fixtures
+    
     def _on_ma_data_changed(self):
         """Handle when ma table data changes."""
         # This is called when fixtures are reordered in the ma table
@@ -393,7 +378,7 @@ class MainWindow(QMainWindow):
         # The fixture order is already updated in the table, so we just need to sync
         pass
     
-    def _update_status_info(self):
+    def _update_status_info(self, stats: Optional[Dict[str, Any]] = None):
         """Update the status information display."""
         fixtures = self.project_state['fixtures']
         if not fixtures:
@@ -404,21 +389,26 @@ class MainWindow(QMainWindow):
         selected_attributes = self.config.get_selected_attributes()
         
         # Get fixture statistics using centralized access method
-        stats = self.get_fixture_statistics()
-        
-        status_text = f"Project Status:\n"
-        status_text += f"• Total fixtures: {stats['total_fixtures']}\n"
-        status_text += f"• Ma fixtures: {stats['ma_fixtures']} ({stats['ma_matched']} matched)\n"
-        status_text += f"• Remote fixtures: {stats['remote_fixtures']} ({stats['remote_matched']} matched)\n"
+        if stats is None:
+            stats = self.get_fixture_statistics()
+        
+        lines = [
+            "Project Status:",
+            f"• Total fixtures: {stats['total_fixtures']}",
+            f"• Ma fixtures: {stats['ma_fixtures']} ({stats['ma_matched']} matched)",
+            f"• Remote fixtures: {stats['remote_fixtures']} ({stats['remote_matched']} matched)",
+        ]
         if stats['unassigned_fixtures'] > 0:
-            status_text += f"• Unassigned fixtures: {stats['unassigned_fixtures']}\n"
-        status_text += f"• Selected attributes: {len(selected_attributes)}"
+            lines.append(f"• Unassigned fixtures: {stats['unassigned_fixtures']}")
         
+        attributes_line = f"• Selected attributes: {len(selected_attributes)}"
         if selected_attributes:
-            status_text += f" ({', '.join(selected_attributes[:5])}"
-            if len(selected_attributes) > 5:
-                status_text += f" +{len(selected_attributes) - 5} more"
-            status_text += ")"
+            extra = len(selected_attributes) - 5
+            more = f" +{extra} more" if extra > 0 else ""
+            attributes_line = f"{attributes_line} ({', '.join(selected_attributes[:5])}{more})"
+        lines.append(attributes_line)
+        
+        status_text = "\n".join(lines)
         
         self.status_label.setText(status_text)
     
@@ -432,16 +422,15 @@ class MainWindow(QMainWindow):
         
         if reply == QMessageBox.StandardButton.Yes:
             self.project_state['fixtures'].clear()
-            self._update_fixtures_tables()
-            self._update_status_info()
-            self._update_ui_state()
+            self._refresh_views()
             self.status_label.setText("Cleared all fixtures")
     
     def _apply_sequence_numbers(self):
         """Apply sequence numbers from ma fixtures to remote fixtures by row number."""
-        # Get ma and remote fixtures using centralized access methods
-        ma_fixtures = self.get_ma_fixtures()
-        remote_fixtures = self.get_remote_fixtures()
+        # Get ma and remote fixtures from one pass over the fixtures
+        partitions = core.partition_fixtures_by_role(self.project_state['fixtures'])
+        ma_fixtures = partitions['ma']
+        remote_fixtures = partitions['remote']
         
         if not ma_fixtures:
             QMessageBox.warning(self, "No Ma Fixtures", "No ma fixtures found. Please import fixtures and set some as ma first.")
@@ -451,69 +440,23 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "No Remote Fixtures", "No remote fixtures found. Please import fixtures and set some as remote first.")
             return
         
-        # Build ma attribute rows (same logic as in _update_ma_table)
-        ma_attribute_rows = []
-        for fixture in ma_fixtures:
-            if fixture.get('matched', False):
-                # Get sorted attributes from the fixture's GDTF profile model
-                profile_model = fixture.get('gdtf_profile')
-                if profile_model:
-                    selected_attributes = profile_model.get_sorted_attributes()
-                else:
-                    # Fallback to unsorted attributes if no profile model
-                    selected_attributes = list(fixture.get('attributes', {}).keys())
-                
-                for attr_name in selected_attributes:
-                    if attr_name in fixture.get('attributes', {}):
-                        sequence_num = fixture.get('sequences', {}).get(attr_name, '—')
-                        ma_attribute_rows.append({
-                            'fixture_id': fixture.get('fixture_id', 0),
-                            'fixture_name': fixture.get('name', ''),
-                            'attribute': attr_name,
-                            'sequence': sequence_num,
-                            'fixture': fixture
-                        })
-        
-        # Build remote attribute rows (same logic as in _update_remote_table)
-        remote_attribute_rows = []
-        for fixture in remote_fixtures:
-            if fixture.get('matched', False):
-                # Get sorted attributes from the fixture's GDTF profile model
-                profile_model = fixture.get('gdtf_profile')
-                if profile_model:
-                    selected_attributes = profile_model.get_sorted_attributes()
-                else:
-                    # Fallback to unsorted attributes if no profile model
-                    selected_attributes = list(fixture.get('attributes', {}).keys())
-                
-                for attr_name in selected_attributes:
-                    if attr_name in fixture.get('attributes', {}):
-                        remote_attribute_rows.append({
-                            'fixture_id': fixture.get('fixture_id', 0),
-                            'fixture_name': fixture.get('name', ''),
-                            'attribute': attr_name,
-                            'fixture': fixture
-                        })
-        
-        # Apply sequences by row number
+        # Walk ma and remote attribute rows (same order as the tables) in lockstep;
+        # zip stops at the shorter side, so rows past it are never built
         applied_count = 0
-        min_rows = min(len(ma_attribute_rows), len(remote_attribute_rows))
+        ma_rows = self._iter_attribute_rows(ma_fixtures)
+        remote_rows = self._iter_attribute_rows(remote_fixtures)
         
-        for i in range(min_rows):
-            ma_row = ma_attribute_rows[i]
-            remote_row = remote_attribute_rows[i]
+        for (ma_fixture, ma_attr), (remote_fixture, remote_attr) in zip(ma_rows, remote_rows):
+            sequence_num = ma_fixture.get('sequences', {}).get(ma_attr, '—')
             
             # Only apply if ma has a valid sequence number
-            if ma_row['sequence'] != '—' and ma_row['sequence'] != '':
-                remote_fixture = remote_row['fixture']
-                attr_name = remote_row['attribute']
-                
+            if sequence_num != '—' and sequence_num != '':
                 # Initialize sequences dict if it doesn't exist
                 if 'sequences' not in remote_fixture:
                     remote_fixture['sequences'] = {}
                 
                 # Copy sequence number
-                remote_fixture['sequences'][attr_name] = ma_row['sequence']
+                remote_fixture['sequences'][remote_attr] = sequence_num
                 applied_count += 1
         
         # Update the tables to show the changes
@@ -525,6 +468,23 @@ class MainWindow(QMainWindow):
         else:
             QMessageBox.information(self, "No Sequences Applied", "No sequence numbers were applied. Make sure ma fixtures have sequence numbers assigned.")
     
+    def _iter_attribute_rows(self, fixtures: List[Dict[str, Any]]):
+        """Yield (fixture, attribute) for each table row of matched fixtures, in display order."""
+        for fixture in fixtures:
+            if fixture.get('matched', False):
+                attributes = fixture.get('attributes', {})
+                # Get sorted attributes from the fixture's GDTF profile model
+                profile_model = fixture.get('gdtf_profile')
+                if profile_model:
+                    selected_attributes = profile_model.get_sorted_attributes()
+                else:
+                    # Fallback to unsorted attributes if no profile model
+                    selected_attributes = list(attributes.keys())
+                
+                for attr_name in selected_attributes:
+                    if attr_name in attributes:
+                        yield fixture, attr_name
+    
     def _renumber_sequences(self):
         """Renumber sequences for ma fixtures based on current order and user settings."""
         from dialogs import RenumberSequencesDialog
@@ -621,12 +581,10 @@ class MainWindow(QMainWindow):
             # Export using the core exporter
             from core.exporter import export_to_ma3_dmx_remotes
             
-            # Generate the XML - pass fixtures directly
-            xml_content = export_to_ma3_dmx_remotes(remote_fixtures, ma3_config)
-            
-            # Save to file
+            # Generate the XML and save it - pass fixtures directly. The content is
+            # not kept in a local so it is freed before the modal result dialog.
             with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(xml_content)
+                f.write(export_to_ma3_dmx_remotes(remote_fixtures, ma3_config))
             
             QMessageBox.information(
                 self,
@@ -666,20 +624,11 @@ class MainWindow(QMainWindow):
         
         try:
             # Export using the core exporter
-            from core.exporter import export_to_ma3_sequences
-            
-            # Generate the XML - pass fixtures directly
-            xml_content = export_to_ma3_sequences(ma_fixtures)
-            
-            # Save to file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(xml_content)
+            from core.exporter import write_ma3_sequences_xml
             
-            # Count sequences generated
-            sequence_count = 0
-            for fixture in ma_fixtures:
-                if fixture.get('matched', False):
-                    sequence_count += len(fixture.get('sequences', {}))
+            # Stream the XML straight to file - pass fixtures directly
+            with open(file_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                sequence_count = write_ma3_sequences_xml(ma_fixtures, f)
             
             QMessageBox.information(
                 self,
@@ -698,67 +647,27 @@ class MainWindow(QMainWindow):
     
     def _export_ma_csv(self):
         """Export ma fixtures as CSV."""
-        from PyQt6.QtWidgets import QFileDialog
-        
         # Get ma fixtures only using centralized access method
-        ma_fixtures = self.get_ma_fixtures()
-        
-        if not ma_fixtures:
-            QMessageBox.warning(self, "No Ma Fixtures", "No ma fixtures found to export.")
-            return
-        
-        # Get save file path from user
-        file_path, _ = QFileDialog.getSaveFileName(
-            self,
-            "Export Ma Fixtures CSV",
-            str(Path.home() / "ma_fixtures.csv"),
-            "CSV Files (*.csv)"
-        )
-        
-        if not file_path:
-            return
-        
-        try:
-            # Export using the core exporter
-            from core.exporter import export_to_csv
-            
-            # Generate the CSV content
-            csv_content = export_to_csv(ma_fixtures)
-            
-            # Save to file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(csv_content)
-            
-            QMessageBox.information(
-                self,
-                "Export Successful",
-                f"Ma fixtures exported successfully to:\n{file_path}"
-            )
-            self.status_label.setText(f"Exported Ma CSV to {Path(file_path).name}")
-            
-        except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Export Error",
-                f"Failed to export Ma CSV:\n{str(e)}"
-            )
+        self._export_role_csv(self.get_ma_fixtures(), "Ma")
     
     def _export_remote_csv(self):
         """Export remote fixtures as CSV."""
-        from PyQt6.QtWidgets import QFileDialog
-        
         # Get remote fixtures only using centralized access method
-        remote_fixtures = self.get_remote_fixtures()
+        self._export_role_csv(self.get_remote_fixtures(), "Remote")
+    
+    def _export_role_csv(self, fixtures: List[Dict[str, Any]], role_label: str):
+        """Export one role's fixtures as CSV (role_label is 'Ma' or 'Remote')."""
+        from PyQt6.QtWidgets import QFileDialog
         
-        if not remote_fixtures:
-            QMessageBox.warning(self, "No Remote Fixtures", "No remote fixtures found to export.")
+        if not fixtures:
+            QMessageBox.warning(self, f"No {role_label} Fixtures", f"No {role_label.lower()} fixtures found to export.")
             return
         
         # Get save file path from user
         file_path, _ = QFileDialog.getSaveFileName(
             self,
-            "Export Remote Fixtures CSV",
-            str(Path.home() / "remote_fixtures.csv"),
+            f"Export {role_label} Fixtures CSV",
+            str(Path.home() / f"{role_label.lower()}_fixtures.csv"),
             "CSV Files (*.csv)"
         )
         
@@ -769,44 +678,41 @@ class MainWindow(QMainWindow):
             # Export using the core exporter
             from core.exporter import export_to_csv
             
-            # Generate the CSV content
-            csv_content = export_to_csv(remote_fixtures)
-            
-            # Save to file
+            # Generate the CSV content and save it without holding on to it
             with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(csv_content)
+                f.write(export_to_csv(fixtures))
             
             QMessageBox.information(
                 self,
                 "Export Successful",
-                f"Remote fixtures exported successfully to:\n{file_path}"
+                f"{role_label} fixtures exported successfully to:\n{file_path}"
             )
-            self.status_label.setText(f"Exported Remote CSV to {Path(file_path).name}")
+            self.status_label.setText(f"Exported {role_label} CSV to {Path(file_path).name}")
             
         except Exception as e:
             QMessageBox.critical(
                 self,
                 "Export Error",
-                f"Failed to export Remote CSV:\n{str(e)}"
+                f"Failed to export {role_label} CSV:\n{str(e)}"
             )
     
-    def _update_ui_state(self):
+    def _update_ui_state(self, stats: Optional[Dict[str, Any]] = None):
         """Update UI state based on current data."""
-        has_fixtures = len(self.project_state['fixtures']) > 0
-        has_selected_attributes = len(self.config.get_selected_attributes()) > 0
-        
-        # Get ma and remote fixtures using centralized access methods
-        ma_fixtures = self.get_ma_fixtures()
-        remote_fixtures = self.get_remote_fixtures()
+        # Only counts are needed here, so use the statistics instead of building role lists
+        if stats is None:
+            stats = self.get_fixture_statistics()
+        has_fixtures = stats['total_fixtures'] > 0
+        has_ma = stats['ma_fixtures'] > 0
+        has_remote = stats['remote_fixtures'] > 0
         
         # Enable/disable buttons
         self.clear_fixtures_button.setEnabled(has_fixtures)
-        self.apply_sequences_button.setEnabled(len(ma_fixtures) > 0 and len(remote_fixtures) > 0)
-        self.renumber_sequences_button.setEnabled(len(ma_fixtures) > 0)
-        self.export_ma3_remotes_button.setEnabled(len(remote_fixtures) > 0)
-        self.export_ma3_sequences_button.setEnabled(len(ma_fixtures) > 0)
-        self.export_ma_csv_button.setEnabled(len(ma_fixtures) > 0)
-        self.export_remote_csv_button.setEnabled(len(remote_fixtures) > 0)
+        self.apply_sequences_button.setEnabled(has_ma and has_remote)
+        self.renumber_sequences_button.setEnabled(has_ma)
+        self.export_ma3_remotes_button.setEnabled(has_remote)
+        self.export_ma3_sequences_button.setEnabled(has_ma)
+        self.export_ma_csv_button.setEnabled(has_ma)
+        self.export_remote_csv_button.setEnabled(has_remote)
     
     def _show_about(self):
         """Show about dialog."""
@@ -908,9 +814,7 @@ class MainWindow(QMainWindow):
             core.reprocess_matched_fixtures(self.project_state['fixtures'])
             
             # Update UI
-            self._update_fixtures_tables()
-            self._update_status_info()
-            self._update_ui_state()
+            self._refresh_views()
             
             QMessageBox.information(
                 self,
@@ -1097,9 +1001,7 @@ class MainWindow(QMainWindow):
             core.reprocess_matched_fixtures(self.project_state['fixtures'])
             
             # Update UI
-            self._update_fixtures_tables()
-            self._update_status_info()
-            self._update_ui_state()
+            self._refresh_views()
             
             QMessageBox.information(
                 self,
@@ -3,28 +3,39 @@ Controller for Attribute Selection Dialog.
 Handles business logic for fixture selection and GDTF matching after import.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple, Iterable
 from pathlib import Path
 import os
+import pickle
+import sys
 import zipfile
 import xml.etree.ElementTree as ET
 import io
 
 import core
 
+# On-disk cache of parsed external GDTF profiles, keyed by file path
+GDTF_CACHE_FILE = Path.home() / ".cache" / "AttributeAddresser" / "gdtf_profiles.pkl"
+# Bump whenever GDTFMode/GDTFProfile change so stale caches are discarded
+GDTF_CACHE_VERSION = 3
+
 class GDTFMode:
+    __slots__ = ('name', 'channels', 'activation_groups', 'total_channels', 'sorted_attributes')
     def __init__(self, name, channels, activation_groups=None, total_channels=0):
         self.name = name
         self.channels = channels
         self.activation_groups = activation_groups or {}
         self.total_channels = total_channels or len(channels)
+        # Channels are fixed after parsing, so sort attribute names once
+        self.sorted_attributes = tuple(sorted(channels))
 
 class GDTFProfile:
+    __slots__ = ('name', 'modes')
     def __init__(self, name, modes):
         self.name = name
         self.modes = modes  # Dict[str, GDTFMode]
     def get_mode_names(self):
-        return list(self.modes.keys())
+        return self.modes.keys()
     def get_mode(self, mode_name):
         return self.modes.get(mode_name)
 
@@ -37,50 +48,50 @@ class AttributeSelectionController:
     def __init__(self, config):
         self.config = config
         self.fixtures = []
+        self.fixtures_by_type = {}  # cleaned fixture type -> fixtures, in first-seen order
         self.gdtf_profiles = {}  # profile_name -> GDTFProfile
+        self.gdtf_profiles_version = 0  # bumped whenever gdtf_profiles changes
+        self._profiles_by_source_cache = None  # (version, profiles_by_source)
         self.fixture_type_matches = {}
         self.external_gdtf_folder = None
         
     def set_fixtures(self, fixtures: List[Dict[str, Any]]):
         """Set the fixtures to work with (only selected fixtures from import)."""
         self.fixtures = fixtures
+        # Remove .gdtf extension once for consistent naming; interned so every
+        # fixture of a type shares one key object for the grouping dict probes
+        self.fixtures_by_type = {}
+        for fixture in fixtures:
+            fixture_type_clean = sys.intern(fixture.get('type', 'Unknown').removesuffix('.gdtf'))
+            self.fixtures_by_type.setdefault(fixture_type_clean, []).append(fixture)
         
     def get_fixture_types_from_selected(self) -> Dict[str, Dict]:
         """Get fixture type information from selected fixtures only."""
         if not self.fixtures:
             return {}
         
-        # Group by fixture type
+        # Fixtures are already grouped by type in set_fixtures
         fixture_types = {}
-        for fixture in self.fixtures:
-            fixture_type = fixture.get('type', 'Unknown')
-            # Remove .gdtf extension for consistent naming
-            fixture_type_clean = fixture_type.replace('.gdtf', '') if fixture_type.endswith('.gdtf') else fixture_type
-            
-            if fixture_type_clean not in fixture_types:
-                fixture_types[fixture_type_clean] = {
-                    'count': 0,
-                    'sample_names': [],
-                    'fixtures': [],
-                    'matched_count': 0,
-                    'current_match': None
-                }
+        for fixture_type_clean, type_fixtures in self.fixtures_by_type.items():
+            # Count matched fixtures and get current match info without copying them out
+            matched_count = 0
+            current_match = None
+            for fixture in type_fixtures:
+                if fixture.get('matched'):
+                    matched_count += 1
+                    if current_match is None:
+                        current_match = {
+                            'profile': fixture.get('gdtf_profile_name'),
+                            'mode': fixture.get('mode')
+                        }
             
-            fixture_types[fixture_type_clean]['count'] += 1
-            fixture_types[fixture_type_clean]['fixtures'].append(fixture)
-            
-            # Track matched fixtures and get current match info
-            if fixture.get('matched'):
-                fixture_types[fixture_type_clean]['matched_count'] += 1
-                if fixture_types[fixture_type_clean]['current_match'] is None:
-                    fixture_types[fixture_type_clean]['current_match'] = {
-                        'profile': fixture.get('gdtf_profile_name'),
-                        'mode': fixture.get('mode')
-                    }
-            
-            # Add sample names (up to 5)
-            if len(fixture_types[fixture_type_clean]['sample_names']) < 5:
-                fixture_types[fixture_type_clean]['sample_names'].append(fixture.get('name', ''))
+            fixture_types[fixture_type_clean] = {
+                'count': len(type_fixtures),
+                'sample_names': [f.get('name', '') for f in type_fixtures[:5]],
+                'fixtures': type_fixtures,
+                'matched_count': matched_count,
+                'current_match': current_match
+            }
         
         return fixture_types
     
@@ -92,14 +103,36 @@ class AttributeSelectionController:
                     "success": False,
                     "error": f"Folder does not exist: {folder_path}"
                 }
-            # Parse external GDTF profiles
+            # Parse external GDTF profiles, reusing cached results for unchanged files
+            cache = self._load_gdtf_cache()
+            cache_changed = False
+            seen_paths = set()
             loaded_profiles = {}
             for file in Path(folder_path).glob("*.gdtf"):
-                profile = self._load_gdtf_from_file(file)
+                file_key = str(file.resolve())
+                file_stat = file.stat()
+                stat_key = (file_stat.st_mtime_ns, file_stat.st_size)
+                seen_paths.add(file_key)
+                cached = cache.get(file_key)
+                if cached is not None and cached[0] == stat_key:
+                    profile = cached[1]
+                else:
+                    profile = self._load_gdtf_from_file(file)
+                    cache[file_key] = (stat_key, profile)
+                    cache_changed = True
                 if profile:
                     loaded_profiles[profile.name] = profile
+            # Drop entries for files that were removed from this folder
+            folder_key = str(Path(folder_path).resolve())
+            for file_key in list(cache):
+                if file_key not in seen_paths and str(Path(file_key).parent) == folder_key:
+                    del cache[file_key]
+                    cache_changed = True
+            if cache_changed:
+                self._save_gdtf_cache(cache)
             if loaded_profiles:
                 self.gdtf_profiles.update(loaded_profiles)
+                self.gdtf_profiles_version += 1
                 self.external_gdtf_folder = folder_path
                 self.config.set_external_gdtf_folder(folder_path)
                 self.config.set_last_gdtf_directory(folder_path)
@@ -118,6 +151,27 @@ class AttributeSelectionController:
                 "success": False,
                 "error": f"Failed to load GDTF profiles: {str(e)}"
             }
+    def _load_gdtf_cache(self) -> Dict[str, Any]:
+        """Load the parsed GDTF profile cache from disk."""
+        try:
+            if not GDTF_CACHE_FILE.exists():
+                return {}
+            with open(GDTF_CACHE_FILE, 'rb') as f:
+                data = pickle.load(f)
+            if not isinstance(data, dict) or data.get('version') != GDTF_CACHE_VERSION:
+                return {}
+            return data.get('profiles', {})
+        except Exception as e:
+            print(f"Error loading GDTF cache: {e}")
+            return {}
+    def _save_gdtf_cache(self, cache: Dict[str, Any]):
+        """Save the parsed GDTF profile cache to disk."""
+        try:
+            GDTF_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(GDTF_CACHE_FILE, 'wb') as f:
+                pickle.dump({'version': GDTF_CACHE_VERSION, 'profiles': cache}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            print(f"Error saving GDTF cache: {e}")
     def _load_gdtf_from_file(self, gdtf_file: Path) -> Optional[GDTFProfile]:
         try:
             with zipfile.ZipFile(gdtf_file, 'r') as gdtf_archive:
@@ -132,8 +186,15 @@ class AttributeSelectionController:
     def _parse_gdtf_xml(self, xml_content: str, filename: str) -> Optional[GDTFProfile]:
         try:
             root = ET.fromstring(xml_content)
-            profile_name = filename.replace('.gdtf', '')
+            profile_name = filename.removesuffix('.gdtf')
             modes = {}
+            # Index attribute definitions once; first definition of a name wins
+            attribute_index = {}
+            for attr_elem in root.iter('Attribute'):
+                attribute_index.setdefault(
+                    attr_elem.get('Name'),
+                    (attr_elem.get('Pretty', attr_elem.get('Name')), attr_elem.get('ActivationGroup'))
+                )
             fixture_type = root.find('FixtureType')
             if fixture_type is not None:
                 dmx_modes_parent = fixture_type.find('DMXModes')
@@ -159,7 +220,7 @@ class AttributeSelectionController:
                                         continue
                                 logical_channel = dmx_channel_elem.find('LogicalChannel')
                                 if logical_channel is not None:
-                                    attribute_name, activation_group = self._extract_attribute_info_from_logical_channel(logical_channel, root)
+                                    attribute_name, activation_group = self._extract_attribute_info_from_logical_channel(logical_channel, attribute_index)
                                     if attribute_name and attribute_name != "NoFeature":
                                         channels[attribute_name] = channel_offset
                                         activation_groups[attribute_name] = activation_group
@@ -174,34 +235,34 @@ class AttributeSelectionController:
         except ET.ParseError as e:
             print(f"Error parsing GDTF XML: {e}")
             return None
-    def _extract_attribute_info_from_logical_channel(self, logical_channel_elem, root):
-        try:
-            attribute_ref = logical_channel_elem.get('Attribute')
-            if not attribute_ref:
-                return None, None
-            for attr_elem in root.findall('.//Attribute'):
-                if attr_elem.get('Name') == attribute_ref:
-                    attribute_name = attr_elem.get('Pretty', attr_elem.get('Name'))
-                    activation_group = attr_elem.get('ActivationGroup')
-                    return attribute_name, activation_group
-            return attribute_ref, None
-        except Exception:
+    def _extract_attribute_info_from_logical_channel(self, logical_channel_elem, attribute_index):
+        # Runs once per DMX channel; a plain dict lookup needs no exception guard
+        attribute_ref = logical_channel_elem.get('Attribute')
+        if not attribute_ref:
             return None, None
+        return attribute_index.get(attribute_ref, (attribute_ref, None))
     def get_profiles_by_source(self) -> Dict[str, List[str]]:
-        profiles_by_source = {'mvr': [], 'external': []}
-        for profile_name in self.gdtf_profiles.keys():
-            profiles_by_source['external'].append(profile_name)
+        # Profile combos are populated once per fixture type; reuse the listing until profiles change
+        cached = self._profiles_by_source_cache
+        if cached is not None and cached[0] == self.gdtf_profiles_version:
+            return cached[1]
+        profiles_by_source = {'mvr': [], 'external': list(self.gdtf_profiles.keys())}
+        self._profiles_by_source_cache = (self.gdtf_profiles_version, profiles_by_source)
         return profiles_by_source
-    def get_profile_modes(self, profile_name: str) -> List[str]:
+    def get_profile_modes(self, profile_name: str) -> Iterable[str]:
+        # Callers only iterate the names into a combo box, so hand back the live keys view
         profile = self.gdtf_profiles.get(profile_name)
         if not profile:
-            return []
+            return ()
         return profile.get_mode_names()
     
     def update_fixture_matches(self, fixture_type_matches: Dict[str, Dict[str, str]], fixture_type_attributes: Dict[str, List[str]] = None) -> Dict[str, Any]:
         """Update fixture matches based on user selections and create GDTF profile models."""
         try:
             updated_count = 0
+            # Resolve one match plan per fixture type before touching any fixture
+            type_plans = {}
+            plan_cache = {}  # (profile, mode, selected attributes) -> match plan
             
             for fixture_type, match_info in fixture_type_matches.items():
                 profile_name = match_info.get('profile')
@@ -218,27 +279,39 @@ class AttributeSelectionController:
                     if fixture_type_attributes and fixture_type in fixture_type_attributes:
                         selected_attributes = fixture_type_attributes[fixture_type]
                     
-                    # Convert GDTFProfile to dictionary format expected by match_fixture_to_gdtf
-                    profile_dict = {
-                        'name': profile.name,
-                        'modes': {}
-                    }
-                    
-                    for mode_name_key, mode_obj in profile.modes.items():
-                        profile_dict['modes'][mode_name_key] = mode_obj.channels
+                    mode_obj = profile.modes.get(mode_name)
+                    if mode_obj is None:
+                        continue
                     
-                    # Update all fixtures of this type
-                    for fixture in self.fixtures:
-                        if fixture.get('type', '').replace('.gdtf', '') == fixture_type:
-                            # Use the core match_fixture_to_gdtf function to properly process the fixture
-                            import core
-                            if core.match_fixture_to_gdtf(fixture, profile_dict, mode_name, selected_attributes):
-                                fixture['gdtf_profile_name'] = profile_name
-                                # Also set activation groups for the fixture
-                                mode_obj = profile.modes.get(mode_name)
-                                if mode_obj:
-                                    fixture['activation_groups'] = mode_obj.activation_groups
-                                updated_count += 1
+                    # Fixture types sharing a profile, mode and attribute selection share one plan
+                    plan_key = (profile_name, mode_name, tuple(selected_attributes))
+                    match_plan = plan_cache.get(plan_key)
+                    if match_plan is None:
+                        # Only the chosen mode is needed in the dictionary format expected by prepare_match
+                        profile_dict = {
+                            'name': profile.name,
+                            'modes': {mode_name: mode_obj.channels}
+                        }
+                        match_plan = plan_cache[plan_key] = core.prepare_match(profile_dict, mode_name, selected_attributes)
+                    type_plans[fixture_type] = (match_plan, profile_name, mode_obj)
+            
+            # Accept fixture type keys with or without the .gdtf extension
+            for fixture_type in list(type_plans):
+                type_plans.setdefault(fixture_type.removesuffix('.gdtf'), type_plans[fixture_type])
+            
+            # Apply each resolved plan to its whole fixture type bucket
+            for fixture_type_clean, type_fixtures in self.fixtures_by_type.items():
+                type_plan = type_plans.get(fixture_type_clean)
+                if type_plan is None:
+                    continue
+                match_plan, profile_name, mode_obj = type_plan
+                for fixture in type_fixtures:
+                    core.apply_match(fixture, match_plan)
+                    fixture['gdtf_profile_name'] = profile_name
+                    # Also set activation groups for the fixture
+                    if mode_obj:
+                        fixture['activation_groups'] = mode_obj.activation_groups
+                updated_count += len(type_fixtures)
             
             # Save matches to config for future use
             self.config.set_fixture_type_matches(fixture_type_matches)
@@ -264,34 +337,16 @@ class AttributeSelectionController:
     
     def get_match_summary(self) -> Dict[str, Any]:
         """Get a summary of the current matching status."""
-        if not self.fixtures:
-            return {
-                "total": 0,
-                "matched": 0,
-                "unmatched": 0,
-                "match_rate": 0.0
-            }
-        
-        total = len(self.fixtures)
-        matched = sum(1 for f in self.fixtures if f.get('matched', False))
-        unmatched = total - matched
-        match_rate = (matched / total * 100) if total > 0 else 0.0
-        
-        return {
-            "total": total,
-            "matched": matched,
-            "unmatched": unmatched,
-            "match_rate": match_rate
-        } 
+        return core.get_match_summary(self.fixtures)
 
-    def get_available_attributes_for_profile_mode(self, profile_name: str, mode_name: str) -> List[str]:
+    def get_available_attributes_for_profile_mode(self, profile_name: str, mode_name: str) -> Tuple[str, ...]:
         profile = self.gdtf_profiles.get(profile_name)
         if not profile:
-            return []
+            return ()
         mode = profile.get_mode(mode_name)
         if not mode:
-            return []
-        return sorted(mode.channels.keys())
+            return ()
+        return mode.sorted_attributes
     def get_fixture_type_attributes(self) -> Dict[str, List[str]]:
         return self.config.get_fixture_type_attributes()
     def set_fixture_type_attributes(self, fixture_type_attributes: Dict[str, List[str]]):
@@ -18,10 +18,11 @@ from .data import (
     get_fixture_attributes, set_fixture_selected, is_fixture_selected,
     set_fixture_role, get_fixture_role, get_ma_fixtures, get_remote_fixtures,
     get_ma_fixtures_matched, get_remote_fixtures_matched,
-    get_fixtures_by_role, get_fixtures_by_role_matched,
+    get_fixtures_by_role, get_fixtures_by_role_matched, partition_fixtures_by_role,
     validate_fixture_roles, ensure_fixture_role_consistency,
-    get_fixture_by_id, get_fixtures_by_type, get_fixtures_by_type_and_role,
-    match_fixture_to_gdtf, assign_sequences, get_export_data,
+    build_fixture_index, get_fixture_by_id, get_fixtures_by_type, get_fixtures_by_type_and_role,
+    match_fixture_to_gdtf, prepare_match, apply_match,
+    assign_sequences, get_export_data,
     calculate_universe_and_channel, reprocess_matched_fixtures
 )
 
@@ -31,6 +32,6 @@ from .csv_parser import (
     parse_csv_file, parse_csv_file_with_fixture_id_validation, get_csv_preview, 
     create_column_mapping, validate_csv_file, get_fixture_count
 )
-from .gdtf_parser import parse_gdtf_file, parse_external_gdtf_folder
+from .gdtf_parser import parse_gdtf_file, parse_gdtf_data, parse_external_gdtf_folder
 from .matcher import auto_match_fixtures, get_match_summary
 from .project import project_manager 
\ No newline at end of file
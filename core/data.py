@@ -3,12 +3,19 @@ Simple data structures for AttributeAddresser.
 All data represented as simple dictionaries and lists for easy state management.
 """
 
+from __future__ import annotations
+
 from typing import Dict, List, Any, Optional
 
+# Roles a fixture may have
+_VALID_ROLES = frozenset(('ma', 'remote', 'none'))
+
 
 class GDTFProfileModel:
     """Model for GDTF profile with selected attributes."""
     
+    __slots__ = ('name', 'mode', 'channels', 'selected_attributes', '_sorted_attributes')
+    
     def __init__(self, name: str, mode: str, channels: Dict[str, int], selected_attributes: List[str] = None):
         self.name = name
         self.mode = mode
@@ -21,7 +28,7 @@ class GDTFProfileModel:
         if self._sorted_attributes is None:
             # Sort selected attributes by their channel offset
             available_attributes = [attr for attr in self.selected_attributes if attr in self.channels]
-            self._sorted_attributes = sorted(available_attributes, key=lambda attr: self.channels[attr])
+            self._sorted_attributes = sorted(available_attributes, key=self.channels.__getitem__)
         return self._sorted_attributes
     
     def set_selected_attributes(self, attributes: List[str]):
@@ -121,42 +128,58 @@ def get_fixture_role(fixture: Dict[str, Any]) -> str:
 
 def get_ma_fixtures(fixtures: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Get all ma fixtures."""
-    return [f for f in fixtures if get_fixture_role(f) == 'ma']
+    return [f for f in fixtures if f.get('fixture_role', 'none') == 'ma']
 
 
 def get_remote_fixtures(fixtures: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Get all remote fixtures."""
-    return [f for f in fixtures if get_fixture_role(f) == 'remote']
+    return [f for f in fixtures if f.get('fixture_role', 'none') == 'remote']
 
 
 def get_ma_fixtures_matched(fixtures: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Get all matched ma fixtures."""
-    return [f for f in fixtures if get_fixture_role(f) == 'ma' and f.get('matched', False)]
+    return [f for f in fixtures if f.get('fixture_role', 'none') == 'ma' and f.get('matched', False)]
 
 
 def get_remote_fixtures_matched(fixtures: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Get all matched remote fixtures."""
-    return [f for f in fixtures if get_fixture_role(f) == 'remote' and f.get('matched', False)]
+    return [f for f in fixtures if f.get('fixture_role', 'none') == 'remote' and f.get('matched', False)]
 
 
 def get_fixtures_by_role(fixtures: List[Dict[str, Any]], role: str) -> List[Dict[str, Any]]:
     """Get fixtures by role (ma, remote, or none)."""
-    return [f for f in fixtures if get_fixture_role(f) == role]
+    return [f for f in fixtures if f.get('fixture_role', 'none') == role]
 
 
 def get_fixtures_by_role_matched(fixtures: List[Dict[str, Any]], role: str) -> List[Dict[str, Any]]:
     """Get matched fixtures by role (ma, remote, or none)."""
-    return [f for f in fixtures if get_fixture_role(f) == role and f.get('matched', False)]
+    return [f for f in fixtures if f.get('fixture_role', 'none') == role and f.get('matched', False)]
+
+
+def partition_fixtures_by_role(fixtures: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Split fixtures by role in one pass.
+    Returns lists for 'ma', 'remote' and 'none', plus 'ma_matched' and 'remote_matched'."""
+    partitions = {'ma': [], 'remote': [], 'none': [], 'ma_matched': [], 'remote_matched': []}
+    for fixture in fixtures:
+        role = fixture.get('fixture_role', 'none')
+        if role not in _VALID_ROLES:
+            continue
+        partitions[role].append(fixture)
+        if role != 'none' and fixture.get('matched', False):
+            partitions[role + '_matched'].append(fixture)
+    return partitions
 
 
 def validate_fixture_roles(fixtures: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Validate fixture roles and return summary statistics."""
-    ma_count = len(get_ma_fixtures(fixtures))
-    remote_count = len(get_remote_fixtures(fixtures))
-    none_count = len(get_fixtures_by_role(fixtures, 'none'))
+    # Build every statistic from one partitioning pass over the fixtures
+    partitions = partition_fixtures_by_role(fixtures)
+    ma_count = len(partitions['ma'])
+    remote_count = len(partitions['remote'])
+    none_count = len(partitions['none'])
     
-    ma_matched = len(get_ma_fixtures_matched(fixtures))
-    remote_matched = len(get_remote_fixtures_matched(fixtures))
+    ma_matched = len(partitions['ma_matched'])
+    remote_matched = len(partitions['remote_matched'])
     
     return {
         'total_fixtures': len(fixtures),
@@ -172,15 +195,24 @@ def validate_fixture_roles(fixtures: List[Dict[str, Any]]) -> Dict[str, Any]:
 
 def ensure_fixture_role_consistency(fixtures: List[Dict[str, Any]]) -> bool:
     """Ensure all fixtures have valid roles assigned."""
+    return all(fixture.get('fixture_role', 'none') in _VALID_ROLES for fixture in fixtures)
+
+
+def build_fixture_index(fixtures: List[Dict[str, Any]]) -> Dict[Any, Dict[str, Any]]:
+    """Build a {fixture_id: fixture} index for repeated get_fixture_by_id lookups.
+    Rebuild it after fixtures are added, removed or renumbered."""
+    index = {}
     for fixture in fixtures:
-        role = get_fixture_role(fixture)
-        if role not in ['ma', 'remote', 'none']:
-            return False
-    return True
+        # First fixture with an ID wins, as with the linear lookup
+        index.setdefault(fixture.get('fixture_id'), fixture)
+    return index
 
 
-def get_fixture_by_id(fixtures: List[Dict[str, Any]], fixture_id: int) -> Optional[Dict[str, Any]]:
-    """Get a specific fixture by its ID."""
+def get_fixture_by_id(fixtures: List[Dict[str, Any]], fixture_id: int,
+                      index: Optional[Dict[Any, Dict[str, Any]]] = None) -> Optional[Dict[str, Any]]:
+    """Get a specific fixture by its ID, using an index from build_fixture_index if given."""
+    if index is not None:
+        return index.get(fixture_id)
     for fixture in fixtures:
         if fixture.get('fixture_id') == fixture_id:
             return fixture
@@ -194,7 +226,7 @@ def get_fixtures_by_type(fixtures: List[Dict[str, Any]], fixture_type: str) -> L
 
 def get_fixtures_by_type_and_role(fixtures: List[Dict[str, Any]], fixture_type: str, role: str) -> List[Dict[str, Any]]:
     """Get fixtures of a specific type and role."""
-    return [f for f in fixtures if f.get('type') == fixture_type and get_fixture_role(f) == role]
+    return [f for f in fixtures if f.get('type') == fixture_type and f.get('fixture_role', 'none') == role]
 
 
 def reprocess_matched_fixtures(fixtures: List[Dict[str, Any]]) -> None:
@@ -209,46 +241,50 @@ def reprocess_matched_fixtures(fixtures: List[Dict[str, Any]]) -> None:
         if not hasattr(profile_model, 'channels'):
             continue
         
-        # Get the mode data from the profile model
-        mode_data = profile_model.channels
-        
-        # Calculate absolute addresses, universes, and channels
-        base = fixture['base_address']
-        fixture['addresses'] = {}
-        fixture['universes'] = {}
-        fixture['channels'] = {}
-        
-        # Preserve original CSV values for display
-        original_csv_universe = fixture.get('csv_universe')
-        original_csv_channel = fixture.get('csv_channel')
-        
-        # Preserve original MA3 values for display
-        original_ma3_universe = fixture.get('ma3_universe')
-        original_ma3_channel = fixture.get('ma3_channel')
-        
-        for attr, offset in mode_data.items():
-            # Calculate absolute DMX address (1-based)
-            # base_address is 1-based, offset is 1-based from GDTF
-            absolute_address = base + (offset - 1)
-            fixture['addresses'][attr] = absolute_address
-            
-            # For CSV fixtures, use the original CSV universe and calculate channel based on offset
-            if original_csv_universe is not None and original_csv_channel is not None:
-                # Use the original CSV universe
-                fixture['universes'][attr] = original_csv_universe
-                # Calculate channel: original channel + offset - 1
-                fixture['channels'][attr] = original_csv_channel + (offset - 1)
-            # For MA3 fixtures, use the original MA3 universe and calculate channel based on offset
-            elif original_ma3_universe is not None and original_ma3_channel is not None:
-                # Use the original MA3 universe
-                fixture['universes'][attr] = original_ma3_universe
-                # Calculate channel: original channel + offset - 1
-                fixture['channels'][attr] = original_ma3_channel + (offset - 1)
-            else:
-                # For other fixtures, calculate universe and channel from absolute address
-                universe, channel = calculate_universe_and_channel(absolute_address)
-                fixture['universes'][attr] = universe
-                fixture['channels'][attr] = channel
+        # Recalculate from the mode data stored on the profile model
+        _calculate_fixture_addresses(fixture, profile_model.channels)
+
+
+def _calculate_fixture_addresses(fixture: Dict[str, Any], mode_data: Dict[str, int]) -> None:
+    """Calculate absolute addresses, universes, and channels for each attribute of a fixture."""
+    base = fixture['base_address']
+    
+    # Calculate absolute DMX address (1-based)
+    # base_address is 1-based, offset is 1-based from GDTF
+    addresses = {attr: base + (offset - 1) for attr, offset in mode_data.items()}
+    fixture['addresses'] = addresses
+    
+    # Preserve original CSV values for display
+    original_csv_universe = fixture.get('csv_universe')
+    original_csv_channel = fixture.get('csv_channel')
+    
+    # Preserve original MA3 values for display
+    original_ma3_universe = fixture.get('ma3_universe')
+    original_ma3_channel = fixture.get('ma3_channel')
+    
+    # The source of universe/channel is the same for every attribute, so pick it once
+    # For CSV fixtures, use the original CSV universe and calculate channel based on offset
+    if original_csv_universe is not None and original_csv_channel is not None:
+        original_universe, original_channel = original_csv_universe, original_csv_channel
+    # For MA3 fixtures, use the original MA3 universe and calculate channel based on offset
+    elif original_ma3_universe is not None and original_ma3_channel is not None:
+        original_universe, original_channel = original_ma3_universe, original_ma3_channel
+    else:
+        # For other fixtures, calculate universe and channel from absolute address
+        # (calculate_universe_and_channel inlined as one divmod per attribute)
+        universes = {}
+        channels = {}
+        for attr, absolute_address in addresses.items():
+            universe_index, channel_index = divmod(absolute_address - 1, 512)
+            universes[attr] = universe_index + 1
+            channels[attr] = channel_index + 1
+        fixture['universes'] = universes
+        fixture['channels'] = channels
+        return
+    
+    # Use the original universe; channel is original channel + offset - 1
+    fixture['universes'] = dict.fromkeys(mode_data, original_universe)
+    fixture['channels'] = {attr: original_channel + (offset - 1) for attr, offset in mode_data.items()}
 
 
 def calculate_universe_and_channel(absolute_address: int, universe_size: int = 512) -> tuple[int, int]:
@@ -259,64 +295,45 @@ def calculate_universe_and_channel(absolute_address: int, universe_size: int = 5
     return universe, channel
 
 
-def match_fixture_to_gdtf(fixture: Dict[str, Any], gdtf_profile: Dict[str, Any], mode: str, selected_attributes: List[str] = None) -> bool:
-    """Match a fixture to a GDTF profile and mode."""
+def prepare_match(gdtf_profile: Dict[str, Any], mode: str, selected_attributes: List[str] = None) -> Optional[Dict[str, Any]]:
+    """Resolve the parts of a GDTF match shared by every fixture of the same type.
+    Returns None if the mode does not exist in the profile."""
     if mode not in gdtf_profile['modes']:
-        return False
+        return None
     
-    mode_data = gdtf_profile['modes'][mode]
+    # One copy of the mode data per plan, shared read-only by the profile model
+    # and the attributes of every fixture the plan is applied to
+    channels = gdtf_profile['modes'][mode].copy()
     
-    # Create GDTFProfileModel
-    profile_model = GDTFProfileModel(
-        name=gdtf_profile['name'],
-        mode=mode,
-        channels=mode_data.copy(),
-        selected_attributes=selected_attributes or []
-    )
-    
-    fixture['gdtf_profile'] = profile_model
-    fixture['mode'] = mode
-    fixture['attributes'] = mode_data.copy()
+    return {
+        'profile_model': GDTFProfileModel(
+            name=gdtf_profile['name'],
+            mode=mode,
+            channels=channels,
+            selected_attributes=selected_attributes or []
+        ),
+        'mode': mode,
+        'channels': channels
+    }
+
+
+def apply_match(fixture: Dict[str, Any], match_plan: Dict[str, Any]) -> None:
+    """Apply a match prepared by prepare_match to a single fixture."""
+    fixture['gdtf_profile'] = match_plan['profile_model']
+    fixture['mode'] = match_plan['mode']
+    fixture['attributes'] = match_plan['channels']
     fixture['matched'] = True
     
-    # Calculate absolute addresses, universes, and channels
-    base = fixture['base_address']
-    fixture['addresses'] = {}
-    fixture['universes'] = {}
-    fixture['channels'] = {}
-    
-    # Preserve original CSV values for display
-    original_csv_universe = fixture.get('csv_universe')
-    original_csv_channel = fixture.get('csv_channel')
-    
-    # Preserve original MA3 values for display
-    original_ma3_universe = fixture.get('ma3_universe')
-    original_ma3_channel = fixture.get('ma3_channel')
-    
-    for attr, offset in mode_data.items():
-        # Calculate absolute DMX address (1-based)
-        # base_address is 1-based, offset is 1-based from GDTF
-        absolute_address = base + (offset - 1)
-        fixture['addresses'][attr] = absolute_address
-        
-        # For CSV fixtures, use the original CSV universe and calculate channel based on offset
-        if original_csv_universe is not None and original_csv_channel is not None:
-            # Use the original CSV universe
-            fixture['universes'][attr] = original_csv_universe
-            # Calculate channel: original channel + offset - 1
-            fixture['channels'][attr] = original_csv_channel + (offset - 1)
-        # For MA3 fixtures, use the original MA3 universe and calculate channel based on offset
-        elif original_ma3_universe is not None and original_ma3_channel is not None:
-            # Use the original MA3 universe
-            fixture['universes'][attr] = original_ma3_universe
-            # Calculate channel: original channel + offset - 1
-            fixture['channels'][attr] = original_ma3_channel + (offset - 1)
-        else:
-            # For other fixtures, calculate universe and channel from absolute address
-            universe, channel = calculate_universe_and_channel(absolute_address)
-            fixture['universes'][attr] = universe
-            fixture['channels'][attr] = channel
+    _calculate_fixture_addresses(fixture, match_plan['channels'])
+
+
+def match_fixture_to_gdtf(fixture: Dict[str, Any], gdtf_profile: Dict[str, Any], mode: str, selected_attributes: List[str] = None) -> bool:
+    """Match a fixture to a GDTF profile and mode."""
+    match_plan = prepare_match(gdtf_profile, mode, selected_attributes)
+    if match_plan is None:
+        return False
     
+    apply_match(fixture, match_plan)
     return True
 
 
@@ -329,7 +346,7 @@ def assign_sequences(fixtures: List[Dict[str, Any]], start_number: int = 1001):
         if not fixture.get('selected') or not fixture.get('matched'):
             continue
             
-        fixture['sequences'] = {}
+        attributes = fixture.get('attributes', {})
         
         # Get sorted attributes from the fixture's GDTF profile model
         profile_model = fixture.get('gdtf_profile')
@@ -337,12 +354,13 @@ def assign_sequences(fixtures: List[Dict[str, Any]], start_number: int = 1001):
             sorted_attributes = profile_model.get_sorted_attributes()
         else:
             # Fallback to unsorted attributes if no profile model
-            sorted_attributes = list(fixture.get('attributes', {}).keys())
+            sorted_attributes = attributes
         
-        for attr in sorted_attributes:
-            if attr in fixture.get('attributes', {}):
-                fixture['sequences'][attr] = sequence_num
-                sequence_num += 1
+        # Number the fixture's attributes consecutively in one go
+        sequence_attributes = [attr for attr in sorted_attributes if attr in attributes]
+        next_sequence_num = sequence_num + len(sequence_attributes)
+        fixture['sequences'] = dict(zip(sequence_attributes, range(sequence_num, next_sequence_num)))
+        sequence_num = next_sequence_num
 
 
 def get_export_data(fixtures: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -354,7 +372,6 @@ def get_export_data(fixtures: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
             continue
         
         # Get fixture type from GDTF profile or fallback to fixture type
-        fixture_type = '—'
         profile_model = fixture.get('gdtf_profile')
         if profile_model and hasattr(profile_model, 'name'):
             fixture_type = profile_model.name
@@ -362,31 +379,33 @@ def get_export_data(fixtures: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
             fixture_type = fixture.get('type', '—')
         
         # Get sorted attributes from the fixture's GDTF profile model
-        profile_model = fixture.get('gdtf_profile')
+        attributes = fixture.get('attributes', {})
         if profile_model:
             sorted_attributes = profile_model.get_sorted_attributes()
         else:
             # Fallback to unsorted attributes if no profile model
-            sorted_attributes = list(fixture.get('attributes', {}).keys())
-            
-        for attr in sorted_attributes:
-            if attr in fixture.get('attributes', {}):
-                # Get universe and channel for proper address formatting
-                universe = fixture['universes'].get(attr, 1)
-                channel = fixture['channels'].get(attr, 1)
-                absolute_address = fixture['addresses'].get(attr, 1)
-                
-                item = {
-                    'fixture_name': fixture['name'],
-                    'fixture_id': fixture['fixture_id'],
-                    'fixture_type': fixture_type,
-                    'attribute': attr,
-                    'universe': universe,
-                    'channel': channel,
-                    'absolute_address': absolute_address,
-                    'sequence': fixture['sequences'].get(attr, 0)
-                }
-                
-                export_data.append(item)
+            sorted_attributes = attributes
+        
+        # Look up the fixture's fields and per-attribute maps once, not per attribute
+        fixture_name = fixture['name']
+        fixture_id = fixture['fixture_id']
+        universes = fixture['universes']
+        channels = fixture['channels']
+        addresses = fixture['addresses']
+        sequences = fixture['sequences']
+        
+        export_data.extend(
+            {
+                'fixture_name': fixture_name,
+                'fixture_id': fixture_id,
+                'fixture_type': fixture_type,
+                'attribute': attr,
+                'universe': universes.get(attr, 1),
+                'channel': channels.get(attr, 1),
+                'absolute_address': addresses.get(attr, 1),
+                'sequence': sequences.get(attr, 0)
+            }
+            for attr in sorted_attributes if attr in attributes
+        )
     
-    return export_data 
\ No newline at end of file
+    return export_data
@@ -3,17 +3,21 @@ Simple export functionality.
 Exports fixture data to various formats using minimal, clean functions.
 """
 
+import io
 import json
 import csv
-from typing import List, Dict, Any
+from operator import itemgetter
+from typing import List, Dict, Any, Optional, TextIO
 from pathlib import Path
 
 from .data import get_export_data
 
 
-def export_to_text(fixtures: List[Dict[str, Any]]) -> str:
+def export_to_text(fixtures: List[Dict[str, Any]],
+                   export_data: Optional[List[Dict[str, Any]]] = None) -> str:
     """Export fixture data to text format."""
-    export_data = get_export_data(fixtures)
+    if export_data is None:
+        export_data = get_export_data(fixtures)
     
     if not export_data:
         return "No fixture data to export."
@@ -39,25 +43,31 @@ def export_to_text(fixtures: List[Dict[str, Any]]) -> str:
     return "\n".join(lines)
 
 
-def export_to_csv(fixtures: List[Dict[str, Any]]) -> str:
+# CSV export columns, named as the export data keys they come from
+_CSV_EXPORT_FIELDS = ('fixture_name', 'fixture_id', 'fixture_type', 'attribute',
+                      'universe', 'channel', 'absolute_address', 'sequence')
+
+
+def export_to_csv(fixtures: List[Dict[str, Any]],
+                  export_data: Optional[List[Dict[str, Any]]] = None) -> str:
     """Export fixture data to CSV format."""
-    export_data = get_export_data(fixtures)
-    
-    if not export_data:
-        return "fixture_name,fixture_id,fixture_type,attribute,universe,channel,absolute_address,sequence\n"
+    if export_data is None:
+        export_data = get_export_data(fixtures)
     
-    lines = []
-    lines.append("fixture_name,fixture_id,fixture_type,attribute,universe,channel,absolute_address,sequence")
-    
-    for item in export_data:
-        lines.append(f"{item['fixture_name']},{item['fixture_id']},{item['fixture_type']},{item['attribute']},{item['universe']},{item['channel']},{item['absolute_address']},{item['sequence']}")
+    # Let the csv module format and quote the rows (names may contain commas or quotes)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    writer.writerow(_CSV_EXPORT_FIELDS)
+    writer.writerows(map(itemgetter(*_CSV_EXPORT_FIELDS), export_data))
     
-    return "\n".join(lines)
+    return buffer.getvalue()
 
 
-def export_to_json(fixtures: List[Dict[str, Any]]) -> str:
+def export_to_json(fixtures: List[Dict[str, Any]],
+                   export_data: Optional[List[Dict[str, Any]]] = None) -> str:
     """Export fixture data to JSON format."""
-    export_data = get_export_data(fixtures)
+    if export_data is None:
+        export_data = get_export_data(fixtures)
     
     # Group by fixture for better JSON structure
     fixtures_dict = {}
@@ -81,9 +91,11 @@ def export_to_json(fixtures: List[Dict[str, Any]]) -> str:
     return json.dumps(list(fixtures_dict.values()), indent=2)
 
 
-def export_to_ma3_xml(fixtures: List[Dict[str, Any]], ma3_config: Dict[str, Any] = None) -> str:
+def export_to_ma3_xml(fixtures: List[Dict[str, Any]], ma3_config: Dict[str, Any] = None,
+                      export_data: Optional[List[Dict[str, Any]]] = None) -> str:
     """Export fixture data to MA3 XML sequence format."""
-    export_data = get_export_data(fixtures)
+    if export_data is None:
+        export_data = get_export_data(fixtures)
     
     if not export_data:
         return "<!-- No fixture data to export -->"
@@ -122,13 +134,15 @@ def export_to_ma3_xml(fixtures: List[Dict[str, Any]], ma3_config: Dict[str, Any]
     return "\n".join(xml_parts)
 
 
-def export_to_ma3_dmx_remotes(fixtures: List[Dict[str, Any]], ma3_config: Dict[str, Any] = None) -> str:
+def export_to_ma3_dmx_remotes(fixtures: List[Dict[str, Any]], ma3_config: Dict[str, Any] = None,
+                              export_data: Optional[List[Dict[str, Any]]] = None) -> str:
     """Export fixture data to MA3 DMX Remotes XML format."""
     import uuid
     from xml.etree.ElementTree import Element, SubElement, tostring
     from xml.dom import minidom
     
-    export_data = get_export_data(fixtures)
+    if export_data is None:
+        export_data = get_export_data(fixtures)
     
     if not export_data:
         return "<!-- No fixture data to export -->"
@@ -189,157 +203,110 @@ def export_to_ma3_dmx_remotes(fixtures: List[Dict[str, Any]], ma3_config: Dict[s
     return '\n'.join(filtered_lines)
 
 
-def export_to_ma3_sequences(fixtures: List[Dict[str, Any]]) -> str:
-    """Export fixture data to MA3 sequences XML format with values set to 100."""
+# MA3 attribute names used in sequence export
+_MA3_SEQUENCE_ATTRIBUTE_MAP = {
+    'Dim': 'Dimmer',
+    'R': 'ColorRGB_R',
+    'G': 'ColorRGB_G', 
+    'B': 'ColorRGB_B',
+    'W': 'ColorRGB_W',
+    'WW': 'ColorRGB_WW',
+    'CW': 'ColorRGB_CW',
+    'White': 'ColorRGB_White',
+    'Pan': 'Position_Pan',
+    'Tilt': 'Position_Tilt',
+    'Zoom': 'Beam_Zoom',
+    'Focus': 'Beam_Focus',
+    'Iris': 'Beam_Iris'
+}
+
+# One pretty-printed <Sequence> element, one line per element
+_MA3_SEQUENCE_TEMPLATE = (
+    '\n    <Sequence Name="{name}" Guid="{sequence_guid}" AutoStart="Yes" AutoStop="Yes" AutoFix="No" AutoStomp="No" '
+    'SoftLTP="Yes" XFadeReload="No" SwapProtect="No" KillProtect="No" UseExecutorTime="Yes" OffwhenOverridden="Yes" '
+    'SequMIB="Enabled" AutoPrePos="No" WrapAround="Yes" MasterGoMode="None" SpeedfromRate="No" Tracking="Yes" '
+    'IncludeLinkLastGo="Yes" RateScale="One" SpeedScale="One" PreferCueAppearance="No" ExecutorDisplayMode="Both" '
+    'Action="Pool Default">'
+    '\n        <Cue Name="OffCue" Release="Yes" Assert="Assert" AllowDuplicates="" TrigType="">'
+    '\n            <Part Guid="{off_guid}" AlignRangeX="No" AlignRangeY="No" AlignRangeZ="No" PreserveGridPositions="No" '
+    'MAgic="No" Mode="0" Action="Pool Default"/>'
+    '\n        </Cue>'
+    '\n        <Cue Name="CueZero" No="  0">'
+    '\n            <Part Guid="{zero_guid}" AlignRangeX="No" AlignRangeY="No" AlignRangeZ="No" PreserveGridPositions="No" '
+    'MAgic="No" Mode="0" Action="Pool Default"/>'
+    '\n        </Cue>'
+    '\n        <Cue No="  1" AllowDuplicates="">'
+    '\n            <Part Guid="{one_guid}" AlignRangeX="No" AlignRangeY="No" AlignRangeZ="No" PreserveGridPositions="No" '
+    'MAgic="No" Mode="0" Action="Pool Default" Sync="" Morph="">'
+    '\n                <PresetData Size="1">'
+    '\n                    <Phaser IDType="0" ID="{fixture_id}" Attribute="{attribute}" GridPos="0" GridPosMatr="0" '
+    'Selective="true">'
+    '\n                        <Step Function="{attribute}" Absolute="100"/>'
+    '\n                    </Phaser>'
+    '\n                </PresetData>'
+    '\n            </Part>'
+    '\n        </Cue>'
+    '\n    </Sequence>'
+)
+
+
+def _xml_attr(value: Any) -> str:
+    """Escape a value for use inside a double-quoted XML attribute."""
+    # Same output as xml.sax.saxutils.escape with a quote entity, without importing
+    # xml.sax.saxutils (it pulls in urllib.request, http.client and email at startup)
+    return str(value).replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;').replace('"', '&quot;')
+
+
+def write_ma3_sequences_xml(fixtures: List[Dict[str, Any]], sink: TextIO,
+                            export_data: Optional[List[Dict[str, Any]]] = None) -> int:
+    """Stream MA3 sequences XML to a text sink, one sequence per fixture attribute.
+    Returns the number of sequences written."""
     import uuid
-    from xml.etree.ElementTree import Element, SubElement, tostring
-    from xml.dom import minidom
     
-    export_data = get_export_data(fixtures)
+    if export_data is None:
+        export_data = get_export_data(fixtures)
     
     if not export_data:
-        return "<!-- No fixture data to export -->"
+        sink.write("<!-- No fixture data to export -->")
+        return 0
     
-    # Create root element
-    root = Element("GMA3", DataVersion="2.2.5.2")
+    def new_guid() -> str:
+        return str(uuid.uuid4()).replace('-', ' ').upper()
+    
+    write = sink.write
+    write('<?xml version="1.0" ?>')
     
-    # Create a sequence for each fixture-attribute combination
+    sequence_count = 0
     for item in export_data:
         if not item['sequence']:  # Skip if no sequence number
             continue
-            
-        # Create sequence element
-        sequence = SubElement(root, "Sequence")
-        
-        # Set sequence attributes - name should be "fixture_id_attribute"
-        sequence_name = f"{item['fixture_id']}_{item['attribute']}"
-        sequence.set("Name", sequence_name)
-        sequence.set("Guid", str(uuid.uuid4()).replace('-', ' ').upper())
-        sequence.set("AutoStart", "Yes")
-        sequence.set("AutoStop", "Yes")
-        sequence.set("AutoFix", "No")
-        sequence.set("AutoStomp", "No")
-        sequence.set("SoftLTP", "Yes")
-        sequence.set("XFadeReload", "No")
-        sequence.set("SwapProtect", "No")
-        sequence.set("KillProtect", "No")
-        sequence.set("UseExecutorTime", "Yes")
-        sequence.set("OffwhenOverridden", "Yes")
-        sequence.set("SequMIB", "Enabled")
-        sequence.set("AutoPrePos", "No")
-        sequence.set("WrapAround", "Yes")
-        sequence.set("MasterGoMode", "None")
-        sequence.set("SpeedfromRate", "No")
-        sequence.set("Tracking", "Yes")
-        sequence.set("IncludeLinkLastGo", "Yes")
-        sequence.set("RateScale", "One")
-        sequence.set("SpeedScale", "One")
-        sequence.set("PreferCueAppearance", "No")
-        sequence.set("ExecutorDisplayMode", "Both")
-        sequence.set("Action", "Pool Default")
-        
-        # Create OffCue
-        off_cue = SubElement(sequence, "Cue")
-        off_cue.set("Name", "OffCue")
-        off_cue.set("Release", "Yes")
-        off_cue.set("Assert", "Assert")
-        off_cue.set("AllowDuplicates", "")
-        off_cue.set("TrigType", "")
-        
-        off_part = SubElement(off_cue, "Part")
-        off_part.set("Guid", str(uuid.uuid4()).replace('-', ' ').upper())
-        off_part.set("AlignRangeX", "No")
-        off_part.set("AlignRangeY", "No")
-        off_part.set("AlignRangeZ", "No")
-        off_part.set("PreserveGridPositions", "No")
-        off_part.set("MAgic", "No")
-        off_part.set("Mode", "0")
-        off_part.set("Action", "Pool Default")
-        
-        # Create CueZero
-        cue_zero = SubElement(sequence, "Cue")
-        cue_zero.set("Name", "CueZero")
-        cue_zero.set("No", "  0")
-        
-        cue_zero_part = SubElement(cue_zero, "Part")
-        cue_zero_part.set("Guid", str(uuid.uuid4()).replace('-', ' ').upper())
-        cue_zero_part.set("AlignRangeX", "No")
-        cue_zero_part.set("AlignRangeY", "No")
-        cue_zero_part.set("AlignRangeZ", "No")
-        cue_zero_part.set("PreserveGridPositions", "No")
-        cue_zero_part.set("MAgic", "No")
-        cue_zero_part.set("Mode", "0")
-        cue_zero_part.set("Action", "Pool Default")
         
-        # Create Cue 1 with the actual data
-        cue_one = SubElement(sequence, "Cue")
-        cue_one.set("No", "  1")
-        cue_one.set("AllowDuplicates", "")
+        if not sequence_count:
+            write('\n<GMA3 DataVersion="2.2.5.2">')
+        sequence_count += 1
         
-        cue_one_part = SubElement(cue_one, "Part")
-        cue_one_part.set("Guid", str(uuid.uuid4()).replace('-', ' ').upper())
-        cue_one_part.set("AlignRangeX", "No")
-        cue_one_part.set("AlignRangeY", "No")
-        cue_one_part.set("AlignRangeZ", "No")
-        cue_one_part.set("PreserveGridPositions", "No")
-        cue_one_part.set("MAgic", "No")
-        cue_one_part.set("Mode", "0")
-        cue_one_part.set("Action", "Pool Default")
-        cue_one_part.set("Sync", "")
-        cue_one_part.set("Morph", "")
-        
-        # Create PresetData
-        preset_data = SubElement(cue_one_part, "PresetData")
-        preset_data.set("Size", "1")  # Only one fixture per sequence
-        
-        # Create Phaser for this specific fixture-attribute combination
-        phaser = SubElement(preset_data, "Phaser")
-        phaser.set("IDType", "0")
-        phaser.set("ID", str(item['fixture_id']))  # Use fixture ID, not sequence number
-        
-        # Map attribute name to MA3 format
-        ma3_attr_map = {
-            'Dim': 'Dimmer',
-            'R': 'ColorRGB_R',
-            'G': 'ColorRGB_G', 
-            'B': 'ColorRGB_B',
-            'W': 'ColorRGB_W',
-            'WW': 'ColorRGB_WW',
-            'CW': 'ColorRGB_CW',
-            'White': 'ColorRGB_White',
-            'Pan': 'Position_Pan',
-            'Tilt': 'Position_Tilt',
-            'Zoom': 'Beam_Zoom',
-            'Focus': 'Beam_Focus',
-            'Iris': 'Beam_Iris'
-        }
-        
-        ma3_attr = ma3_attr_map.get(item['attribute'], item['attribute'])
-        phaser.set("Attribute", ma3_attr)
-        phaser.set("GridPos", "0")
-        phaser.set("GridPosMatr", "0")
-        phaser.set("Selective", "true")
-        
-        # Create Step with value 100
-        step = SubElement(phaser, "Step")
-        step.set("Function", ma3_attr)
-        step.set("Absolute", "100")
-    
-    # Convert to pretty-printed XML string
-    rough_string = tostring(root, encoding='unicode')
-    reparsed = minidom.parseString(rough_string)
-    pretty_xml = reparsed.toprettyxml(indent="    ", encoding=None)
-    
-    # Add proper XML declaration and format
-    lines = pretty_xml.split('\n')
-    # Filter out empty lines and fix formatting
-    filtered_lines = [line for line in lines if line.strip()]
-    
-    # Ensure proper XML declaration
-    if not filtered_lines[0].startswith('<?xml'):
-        filtered_lines.insert(0, '<?xml version="1.0" encoding="UTF-8"?>')
-    
-    return '\n'.join(filtered_lines)
+        attribute = item['attribute']
+        write(_MA3_SEQUENCE_TEMPLATE.format(
+            # Sequence name should be "fixture_id_attribute"
+            name=_xml_attr(f"{item['fixture_id']}_{attribute}"),
+            sequence_guid=new_guid(),
+            off_guid=new_guid(),
+            zero_guid=new_guid(),
+            one_guid=new_guid(),
+            fixture_id=_xml_attr(item['fixture_id']),  # Use fixture ID, not sequence number
+            attribute=_xml_attr(_MA3_SEQUENCE_ATTRIBUTE_MAP.get(attribute, attribute))
+        ))
+    
+    write('\n</GMA3>' if sequence_count else '\n<GMA3 DataVersion="2.2.5.2"/>')
+    return sequence_count
+
+
+def export_to_ma3_sequences(fixtures: List[Dict[str, Any]],
+                            export_data: Optional[List[Dict[str, Any]]] = None) -> str:
+    """Export fixture data to MA3 sequences XML format with values set to 100."""
+    buffer = io.StringIO()
+    write_ma3_sequences_xml(fixtures, buffer, export_data)
+    return buffer.getvalue()
 
 
 def _value_to_hex(value: int) -> str:
@@ -441,19 +408,24 @@ def get_export_formats() -> List[str]:
 
 
 def export_fixtures(fixtures: List[Dict[str, Any]], selected_attributes: List[str], 
-                   export_format: str, ma3_config: Dict[str, Any] = None) -> str:
-    """Export fixtures in the specified format."""
+                   export_format: str, ma3_config: Dict[str, Any] = None,
+                   export_data: Optional[List[Dict[str, Any]]] = None) -> str:
+    """Export fixtures in the specified format.
+    Pass export_data from get_export_data to reuse it when writing several formats."""
+    if export_data is None:
+        export_data = get_export_data(fixtures)
+    
     if export_format == 'text':
-        return export_to_text(fixtures)
+        return export_to_text(fixtures, export_data)
     elif export_format == 'csv':
-        return export_to_csv(fixtures)
+        return export_to_csv(fixtures, export_data)
     elif export_format == 'json':
-        return export_to_json(fixtures)
+        return export_to_json(fixtures, export_data)
     elif export_format == 'ma3_xml':
-        return export_to_ma3_xml(fixtures, ma3_config)
+        return export_to_ma3_xml(fixtures, ma3_config, export_data)
     elif export_format == 'ma3_dmx_remotes':
-        return export_to_ma3_dmx_remotes(fixtures, ma3_config)
+        return export_to_ma3_dmx_remotes(fixtures, ma3_config, export_data)
     elif export_format == 'ma3_sequences':
-        return export_to_ma3_sequences(fixtures)
+        return export_to_ma3_sequences(fixtures, export_data)
     else:
-        raise ValueError(f"Unknown export format: {export_format}") 
\ No newline at end of file
+        raise ValueError(f"Unknown export format: {export_format}")
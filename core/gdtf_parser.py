@@ -3,6 +3,7 @@ Simple GDTF file parser.
 Extracts channel mappings from GDTF files using minimal, clean functions.
 """
 
+import io
 import zipfile
 import xml.etree.ElementTree as ET
 from typing import Dict, Any, Optional
@@ -15,36 +16,52 @@ def parse_gdtf_file(gdtf_path: str) -> Optional[Dict[str, Any]]:
     """Parse GDTF file and extract mode/channel information."""
     try:
         with zipfile.ZipFile(gdtf_path, 'r') as zip_file:
-            # Find the description.xml file
-            description_content = None
-            for file_name in zip_file.namelist():
-                if file_name.endswith('description.xml'):
-                    description_content = zip_file.read(file_name).decode('utf-8')
-                    break
-            
-            if not description_content:
-                return None
-            
-            # Parse XML
-            root = ET.fromstring(description_content)
-            
-            # Extract fixture type name
-            fixture_type = root.find('.//FixtureType')
-            if fixture_type is None:
-                return None
-            
-            name = fixture_type.get('Name', Path(gdtf_path).stem)
-            
-            # Extract modes
-            modes = _extract_modes_from_xml(root)
-            
-            return create_gdtf_profile(name, modes)
+            return _parse_gdtf_archive(zip_file, Path(gdtf_path).stem)
             
     except Exception as e:
         print(f"Error parsing GDTF file {gdtf_path}: {e}")
         return None
 
 
+def parse_gdtf_data(gdtf_data: bytes, gdtf_name: str) -> Optional[Dict[str, Any]]:
+    """Parse GDTF archive bytes already held in memory (e.g. embedded in an MVR)."""
+    try:
+        with zipfile.ZipFile(io.BytesIO(gdtf_data), 'r') as zip_file:
+            return _parse_gdtf_archive(zip_file, Path(gdtf_name).stem)
+            
+    except Exception as e:
+        print(f"Error parsing GDTF file {gdtf_name}: {e}")
+        return None
+
+
+def _parse_gdtf_archive(zip_file: zipfile.ZipFile, default_name: str) -> Optional[Dict[str, Any]]:
+    """Extract mode/channel information from an open GDTF archive."""
+    # Find the description.xml file
+    description_content = None
+    for file_name in zip_file.namelist():
+        if file_name.endswith('description.xml'):
+            description_content = zip_file.read(file_name).decode('utf-8')
+            break
+    
+    if not description_content:
+        return None
+    
+    # Parse XML
+    root = ET.fromstring(description_content)
+    
+    # Extract fixture type name
+    fixture_type = root.find('.//FixtureType')
+    if fixture_type is None:
+        return None
+    
+    name = fixture_type.get('Name', default_name)
+    
+    # Extract modes
+    modes = _extract_modes_from_xml(root)
+    
+    return create_gdtf_profile(name, modes)
+
+
 def _extract_modes_from_xml(root: ET.Element) -> Dict[str, Dict[str, int]]:
     """Extract DMX modes and their channel mappings."""
     modes = {}
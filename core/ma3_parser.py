@@ -55,7 +55,7 @@ def _parse_fixture_element(fixture_elem: ET.Element, fixture_id: int) -> Optiona
         name = fixture_elem.get('Name', f'Fixture_{fixture_id}')
         uuid = fixture_elem.get('Guid', '')
         mode = fixture_elem.get('Mode', '')
-        fid = fixture_elem.get('FID', str(fixture_id))
+        fid = fixture_elem.get('FID')
         
         # Parse patch information to get universe and channel
         patch = fixture_elem.get('Patch', '1.001')
@@ -4,14 +4,27 @@ Matches fixtures to GDTF profiles using minimal, clean functions.
 """
 
 from typing import List, Dict, Any, Optional
+from functools import lru_cache
+import operator
 import re
 
-from .data import match_fixture_to_gdtf, assign_sequences
+from .data import match_fixture_to_gdtf, prepare_match, apply_match, assign_sequences
+
+# Minimum similarity for a fuzzy fixture type -> profile match
+_PROFILE_MATCH_THRESHOLD = 0.7
+# Score given when one normalized name contains the other
+_CONTAINMENT_SCORE = 0.8
 
 
 def auto_match_fixtures(fixtures: List[Dict[str, Any]], 
                        gdtf_profiles: Dict[str, Dict[str, Any]]) -> None:
     """Automatically match fixtures to GDTF profiles where possible."""
+    profile_index = _build_profile_index(gdtf_profiles)
+    # Fixtures of the same type resolve to the same profile, so look each type up once
+    resolved_profiles = {}
+    # Likewise each (type, mode) pair resolves to one match plan shared by its fixtures
+    resolved_plans = {}
+    
     for fixture in fixtures:
         if fixture.get('matched'):
             continue
@@ -19,35 +32,67 @@ def auto_match_fixtures(fixtures: List[Dict[str, Any]],
         fixture_type = fixture.get('type', '')
         fixture_mode = fixture.get('mode', '')
         
-        # Try exact match first
-        matched_profile = _find_exact_match(fixture_type, gdtf_profiles)
-        
-        # If no exact match, try fuzzy matching
-        if not matched_profile:
-            matched_profile = _find_fuzzy_match(fixture_type, gdtf_profiles)
+        if fixture_type in resolved_profiles:
+            matched_profile = resolved_profiles[fixture_type]
+        else:
+            # Try exact match first
+            matched_profile = _find_exact_match(fixture_type, gdtf_profiles, profile_index)
+            
+            # If no exact match, try fuzzy matching
+            if not matched_profile:
+                matched_profile = _find_fuzzy_match(fixture_type, profile_index)
+            resolved_profiles[fixture_type] = matched_profile
         
         if matched_profile:
-            # Find matching mode
-            best_mode = _find_best_mode(fixture_mode, matched_profile)
-            if best_mode:
-                match_fixture_to_gdtf(fixture, matched_profile, best_mode)
+            plan_key = (fixture_type, fixture_mode)
+            if plan_key in resolved_plans:
+                match_plan = resolved_plans[plan_key]
+            else:
+                # Find matching mode
+                best_mode = _find_best_mode(fixture_mode, matched_profile)
+                match_plan = prepare_match(matched_profile, best_mode) if best_mode else None
+                resolved_plans[plan_key] = match_plan
+            if match_plan:
+                apply_match(fixture, match_plan)
+
+
+def _build_profile_index(gdtf_profiles: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Build lookup tables over GDTF profiles for repeated matching."""
+    by_name = {}
+    by_normalized = {}
+    normalized = []
+    for profile_name, profile in gdtf_profiles.items():
+        profile_display_name = profile.get('name', '')
+        # Keep the first profile per display name, like a linear scan would
+        by_name.setdefault(profile_display_name, profile)
+        normalized_name = _normalize_string(profile_name)
+        normalized_display_name = _normalize_string(profile_display_name)
+        # Key and display name often normalize the same; score each distinct non-empty name once
+        candidates = tuple(dict.fromkeys(key for key in (normalized_name, normalized_display_name) if key))
+        # An identical normalized name scores 1.0, so the first such profile always wins
+        for key in candidates:
+            by_normalized.setdefault(key, profile)
+        normalized.append((candidates, profile))
+    
+    return {
+        'by_name': by_name,
+        'by_normalized': by_normalized,
+        'normalized': normalized
+    }
 
 
-def _find_exact_match(fixture_type: str, gdtf_profiles: Dict[str, Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+def _find_exact_match(fixture_type: str, gdtf_profiles: Dict[str, Dict[str, Any]],
+                      profile_index: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """Find exact match between fixture type and GDTF profile."""
     # Direct name match
     if fixture_type in gdtf_profiles:
         return gdtf_profiles[fixture_type]
     
     # Try profile names
-    for profile_name, profile in gdtf_profiles.items():
-        if profile['name'] == fixture_type:
-            return profile
-    
-    return None
+    return profile_index['by_name'].get(fixture_type)
 
 
-def _find_fuzzy_match(fixture_type: str, gdtf_profiles: Dict[str, Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+def _find_fuzzy_match(fixture_type: str, profile_index: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """Find fuzzy match between fixture type and GDTF profile."""
     if not fixture_type:
         return None
@@ -55,44 +100,55 @@ def _find_fuzzy_match(fixture_type: str, gdtf_profiles: Dict[str, Dict[str, Any]
     # Normalize fixture type for comparison
     normalized_fixture = _normalize_string(fixture_type)
     
+    # Identical normalized names need no similarity scoring
+    exact_match = profile_index['by_normalized'].get(normalized_fixture)
+    if exact_match is not None:
+        return exact_match
+    
+    if not normalized_fixture:
+        return None
+    
+    fixture_length = len(normalized_fixture)
     best_match = None
     best_score = 0
     
-    for profile_name, profile in gdtf_profiles.items():
-        # Check profile key name
-        score = _calculate_similarity(normalized_fixture, _normalize_string(profile_name))
-        if score > best_score:
-            best_score = score
-            best_match = profile
-        
-        # Check profile display name
-        profile_display_name = profile.get('name', '')
-        score = _calculate_similarity(normalized_fixture, _normalize_string(profile_display_name))
-        if score > best_score:
-            best_score = score
-            best_match = profile
+    for candidates, profile in profile_index['normalized']:
+        # Check profile key name, then profile display name
+        for candidate in candidates:
+            # A non-identical name scores at most the containment score or its length
+            # ratio; skip candidates that cannot beat the current best or the threshold
+            shorter, longer = sorted((fixture_length, len(candidate)))
+            if max(_CONTAINMENT_SCORE, shorter / longer) <= max(best_score, _PROFILE_MATCH_THRESHOLD):
+                continue
+            score = _calculate_similarity(normalized_fixture, candidate)
+            if score > best_score:
+                best_score = score
+                best_match = profile
     
     # Only return match if similarity is high enough
-    return best_match if best_score > 0.7 else None
+    return best_match if best_score > _PROFILE_MATCH_THRESHOLD else None
 
 
 def _find_best_mode(fixture_mode: str, gdtf_profile: Dict[str, Any]) -> Optional[str]:
     """Find best matching mode in GDTF profile."""
-    available_modes = list(gdtf_profile.get('modes', {}).keys())
+    available_modes = gdtf_profile.get('modes', {})
     
     if not available_modes:
         return None
     
     # If no mode specified, return first available
+    first_mode = next(iter(available_modes))
     if not fixture_mode:
-        return available_modes[0]
+        return first_mode
     
-    # Try exact match first
+    # Try exact match first (dict membership, no list scan)
     if fixture_mode in available_modes:
         return fixture_mode
     
     # Fuzzy match on mode names
     normalized_mode = _normalize_string(fixture_mode)
+    if not normalized_mode:
+        return first_mode
     best_match = None
     best_score = 0
     
@@ -101,23 +157,40 @@ def _find_best_mode(fixture_mode: str, gdtf_profile: Dict[str, Any]) -> Optional
         if score > best_score:
             best_score = score
             best_match = mode
+            # Identical normalized names cannot be beaten
+            if score == 1.0:
+                break
     
     # Return best match if similarity is reasonable
-    return best_match if best_score > 0.5 else available_modes[0]
+    return best_match if best_score > 0.5 else first_mode
+
 
+_NON_ALNUM = re.compile(r'[^a-z0-9]')
 
+
+# Type, profile and mode names recur across fixtures and matching runs
+@lru_cache(maxsize=4096)
 def _normalize_string(text: str) -> str:
     """Normalize string for comparison."""
     if not text:
         return ''
     
     # Convert to lowercase and remove special characters
-    normalized = re.sub(r'[^a-z0-9]', '', text.lower())
+    normalized = _NON_ALNUM.sub('', text.lower())
     return normalized
 
 
 def _calculate_similarity(str1: str, str2: str) -> float:
     """Calculate similarity between two strings."""
+    # The score is symmetric, so order the pair to share cache entries
+    if str2 < str1:
+        str1, str2 = str2, str1
+    return _similarity_of_ordered_pair(str1, str2)
+
+
+@lru_cache(maxsize=65536)
+def _similarity_of_ordered_pair(str1: str, str2: str) -> float:
+    """Similarity score for a pair already ordered by _calculate_similarity."""
     if not str1 or not str2:
         return 0.0
     
@@ -126,17 +199,12 @@ def _calculate_similarity(str1: str, str2: str) -> float:
     
     # Check if one is contained in the other
     if str1 in str2 or str2 in str1:
-        return 0.8
-    
-    # Simple character-based similarity
-    longer = str1 if len(str1) > len(str2) else str2
-    shorter = str2 if len(str1) > len(str2) else str1
+        return _CONTAINMENT_SCORE
     
-    if len(longer) == 0:
-        return 1.0
-    
-    matches = sum(1 for i, char in enumerate(shorter) if i < len(longer) and char == longer[i])
-    return matches / len(longer)
+    # Simple character-based similarity (both strings are non-empty here);
+    # map stops at the shorter string, so no longer/shorter split is needed
+    matches = sum(map(operator.eq, str1, str2))
+    return matches / max(len(str1), len(str2))
 
 
 def manual_match_fixture(fixture: Dict[str, Any], gdtf_profile: Dict[str, Any], mode: str) -> bool:
@@ -147,15 +215,23 @@ def manual_match_fixture(fixture: Dict[str, Any], gdtf_profile: Dict[str, Any],
 def get_match_summary(fixtures: List[Dict[str, Any]]) -> Dict[str, int]:
     """Get summary of matching results."""
     total = len(fixtures)
-    matched = sum(1 for f in fixtures if f.get('matched', False))
-    selected = sum(1 for f in fixtures if f.get('selected', False))
+    if not total:
+        return {'total': 0, 'matched': 0, 'unmatched': 0, 'selected': 0, 'match_rate': 0}
+    
+    matched = 0
+    selected = 0
+    for f in fixtures:
+        if f.get('matched', False):
+            matched += 1
+        if f.get('selected', False):
+            selected += 1
     
     return {
         'total': total,
         'matched': matched,
         'unmatched': total - matched,
         'selected': selected,
-        'match_rate': (matched / total * 100) if total > 0 else 0
+        'match_rate': matched / total * 100
     }
 
 
@@ -7,10 +7,9 @@ import zipfile
 import xml.etree.ElementTree as ET
 from typing import List, Dict, Any, Optional
 from pathlib import Path
-import tempfile
-import os
 
 from .data import create_fixture
+from .gdtf_parser import parse_gdtf_data
 
 
 def parse_mvr_file(mvr_path: str) -> Dict[str, Any]:
@@ -125,7 +124,7 @@ def _parse_fixture_element(fixture_elem: ET.Element, fixture_id: int) -> Optiona
         fixture_id_elem = fixture_elem.find('FixtureID')
         if fixture_id_elem is not None:
             try:
-                parsed_fixture_id = int(fixture_id_elem.text or fixture_id_elem.get('value', str(fixture_id)))
+                parsed_fixture_id = int(fixture_id_elem.text or fixture_id_elem.get('value'))
             except (ValueError, TypeError):
                 parsed_fixture_id = fixture_id
         
@@ -164,21 +163,9 @@ def _extract_gdtf_profiles(zip_file: zipfile.ZipFile) -> Dict[str, Dict[str, Any
 def _parse_gdtf_file_from_zip(zip_file: zipfile.ZipFile, gdtf_filename: str) -> Optional[Dict[str, Any]]:
     """Parse GDTF file from within MVR zip."""
     try:
-        # Extract GDTF file to temporary location
+        # Parse the embedded archive in memory instead of round-tripping through a temp file
         gdtf_data = zip_file.read(gdtf_filename)
-        
-        with tempfile.NamedTemporaryFile(suffix='.gdtf', delete=False) as temp_file:
-            temp_file.write(gdtf_data)
-            temp_path = temp_file.name
-        
-        try:
-            # Parse the GDTF file
-            import core.gdtf_parser as gdtf_parser
-            return gdtf_parser.parse_gdtf_file(temp_path)
-        finally:
-            # Clean up temporary file
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+        return parse_gdtf_data(gdtf_data, gdtf_filename)
                 
     except Exception as e:
         print(f"Error extracting GDTF from zip: {e}")
@@ -189,7 +176,7 @@ def validate_mvr_file(mvr_path: str) -> bool:
     """Check if file is a valid MVR file."""
     try:
         # Accept .mvr files primarily, but be flexible with extensions
-        if not (mvr_path.endswith('.mvr') or mvr_path.endswith('.zip')):
+        if not mvr_path.endswith(('.mvr', '.zip')):
             return False
         
         with zipfile.ZipFile(mvr_path, 'r') as zip_file:
@@ -150,6 +150,9 @@ class ProjectManager:
     
     def _serialize_value(self, value: Any) -> Any:
         """Serialize a single value, handling GDTFProfileModel objects."""
+        # Scalars make up most fixture values; skip the to_dict probe for them
+        if value is None or isinstance(value, (str, int, float)):
+            return value
         if hasattr(value, 'to_dict') and callable(getattr(value, 'to_dict')):
             # Convert objects with to_dict method to dictionaries
             return value.to_dict()
@@ -3,7 +3,7 @@ GDTF Profile Matching Dialog.
 Allows users to match fixture types to GDTF profiles and modes, and select attributes for analysis.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Iterable
 from pathlib import Path
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, 
@@ -31,6 +31,8 @@ class GDTFMatchingDialog(QDialog):
         self.fixture_type_controls = {}
         self.gdtf_profiles = {}
         self.external_profiles = {}
+        self._all_profiles_cache = None  # merged profiles, reset when either set is replaced
+        self._available_attributes_cache = None  # sorted attribute names across all profiles
         
         self.setWindowTitle("GDTF Profile Matching & Attribute Selection")
         self.setMinimumSize(1200, 800)
@@ -176,12 +178,35 @@ class GDTFMatchingDialog(QDialog):
             if fixture.get('gdtf_profile'):
                 profile_name = fixture.get('type', 'Unknown')
                 self.gdtf_profiles[profile_name] = fixture['gdtf_profile']
+        self._invalidate_profile_caches()
         
         # Load external GDTF folder if configured
         external_folder = self.config.get_external_gdtf_folder()
         if external_folder and Path(external_folder).exists():
             self._load_external_gdtf_profiles(external_folder, update_ui=False)
     
+    def _invalidate_profile_caches(self):
+        """Drop merged profile data after gdtf_profiles or external_profiles is replaced."""
+        self._all_profiles_cache = None
+        self._available_attributes_cache = None
+    
+    def _get_all_profiles(self) -> Dict[str, Any]:
+        """Get fixture and external profiles merged, external taking precedence."""
+        if self._all_profiles_cache is None:
+            self._all_profiles_cache = {**self.gdtf_profiles, **self.external_profiles}
+        return self._all_profiles_cache
+    
+    def _get_available_attributes(self) -> List[str]:
+        """Get the sorted attribute names offered by any mode of any profile."""
+        if self._available_attributes_cache is None:
+            all_attributes = set()
+            for profile in self._get_all_profiles().values():
+                if 'modes' in profile:
+                    for mode in profile['modes'].values():
+                        all_attributes.update(mode.keys())
+            self._available_attributes_cache = sorted(all_attributes)
+        return self._available_attributes_cache
+    
     def _load_fixture_types(self):
         """Load all fixture types and create matching controls."""
         # Clear existing controls
@@ -195,26 +220,31 @@ class GDTFMatchingDialog(QDialog):
         fixture_types = {}
         for fixture in self.fixtures:
             fixture_type = fixture.get('type', 'Unknown')
-            if fixture_type not in fixture_types:
-                fixture_types[fixture_type] = {
+            type_info = fixture_types.get(fixture_type)
+            if type_info is None:
+                type_info = fixture_types[fixture_type] = {
                     'count': 0,
+                    'matched_count': 0,
                     'fixtures': [],
                     'sample_names': [],
                     'current_profile': None,
                     'current_mode': None
                 }
             
-            fixture_types[fixture_type]['count'] += 1
-            fixture_types[fixture_type]['fixtures'].append(fixture)
+            type_info['count'] += 1
+            type_info['fixtures'].append(fixture)
             
-            # Add sample names (up to 3)
-            if len(fixture_types[fixture_type]['sample_names']) < 3:
-                fixture_types[fixture_type]['sample_names'].append(fixture.get('name', ''))
+            # Add sample names (first 3 only)
+            sample_names = type_info['sample_names']
+            if len(sample_names) < 3:
+                sample_names.append(fixture.get('name', ''))
             
-            # Track current profile/mode if already matched
-            if fixture.get('matched') and not fixture_types[fixture_type]['current_profile']:
-                fixture_types[fixture_type]['current_profile'] = fixture.get('gdtf_profile_name')
-                fixture_types[fixture_type]['current_mode'] = fixture.get('mode')
+            # Count matched fixtures and track current profile/mode
+            if fixture.get('matched'):
+                type_info['matched_count'] += 1
+                if not type_info['current_profile']:
+                    type_info['current_profile'] = fixture.get('gdtf_profile_name')
+                    type_info['current_mode'] = fixture.get('mode')
         
         if not fixture_types:
             no_fixtures_label = QLabel("No fixtures loaded.")
@@ -223,7 +253,7 @@ class GDTFMatchingDialog(QDialog):
             return
         
         # Check if we have any GDTF profiles available
-        all_profiles = {**self.gdtf_profiles, **self.external_profiles}
+        all_profiles = self._get_all_profiles()
         if not all_profiles:
             self._show_no_profiles_guidance()
         
@@ -238,7 +268,7 @@ class GDTFMatchingDialog(QDialog):
     def _create_fixture_type_control(self, fixture_type: str, info: Dict) -> QWidget:
         """Create UI controls for a fixture type."""
         # Determine match status
-        matched_count = sum(1 for f in info['fixtures'] if f.get('matched'))
+        matched_count = info['matched_count']
         total_count = info['count']
         is_fully_matched = matched_count == total_count and matched_count > 0
         
@@ -328,7 +358,7 @@ class GDTFMatchingDialog(QDialog):
             item.setFont(font)
             item.setForeground(QColor(100, 100, 100))
             
-            for profile_name in sorted(self.gdtf_profiles.keys()):
+            for profile_name in sorted(self.gdtf_profiles):
                 profile_combo.addItem(f"  {profile_name}", profile_name)
         
         # Add External profiles section
@@ -342,7 +372,7 @@ class GDTFMatchingDialog(QDialog):
             item.setFont(font)
             item.setForeground(QColor(100, 100, 100))
             
-            for profile_name in sorted(self.external_profiles.keys()):
+            for profile_name in sorted(self.external_profiles):
                 profile_combo.addItem(f"  {profile_name}", profile_name)
     
     def _on_profile_changed(self, fixture_type: str, profile_name: str):
@@ -366,12 +396,12 @@ class GDTFMatchingDialog(QDialog):
         # Update attribute list
         self._update_attribute_list()
     
-    def _get_profile_modes(self, profile_name: str) -> List[str]:
-        """Get available modes for a specific GDTF profile."""
+    def _get_profile_modes(self, profile_name: str) -> Iterable[str]:
+        """Get available modes for a specific GDTF profile (a keys view, not a copy)."""
         profile = self.gdtf_profiles.get(profile_name) or self.external_profiles.get(profile_name)
         if profile and 'modes' in profile:
-            return list(profile['modes'].keys())
-        return []
+            return profile['modes'].keys()
+        return ()
     
     def _browse_gdtf_folder(self):
         """Browse for external GDTF folder."""
@@ -397,6 +427,7 @@ class GDTFMatchingDialog(QDialog):
         """Load external GDTF profiles from folder."""
         try:
             self.external_profiles = core.parse_external_gdtf_folder(folder_path)
+            self._invalidate_profile_caches()
             
             # Update UI
             if update_ui:
@@ -454,17 +485,8 @@ class GDTFMatchingDialog(QDialog):
         """Update the attribute selection list based on available profiles."""
         self.attributes_list.clear()
         
-        # Collect all available attributes from all profiles
-        all_attributes = set()
-        all_profiles = {**self.gdtf_profiles, **self.external_profiles}
-        
-        for profile in all_profiles.values():
-            if 'modes' in profile:
-                for mode in profile['modes'].values():
-                    all_attributes.update(mode.keys())
-        
-        # Add attributes to list with checkboxes
-        for attr_name in sorted(all_attributes):
+        # Add attributes from all profiles to list with checkboxes
+        for attr_name in self._get_available_attributes():
             item = QListWidgetItem(attr_name)
             item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
             item.setCheckState(Qt.CheckState.Unchecked)
@@ -502,12 +524,14 @@ class GDTFMatchingDialog(QDialog):
     
     def _auto_match_all(self):
         """Auto-match all fixture types to available GDTF profiles."""
-        all_profiles = {**self.gdtf_profiles, **self.external_profiles}
+        all_profiles = self._get_all_profiles()
         if not all_profiles:
             QMessageBox.information(self, "No Profiles", "No GDTF profiles available for matching.")
             return
         
         matches_made = 0
+        # Lowercase profile names once rather than for every fixture type comparison
+        lowered_profiles = [(profile_name, profile_name.lower()) for profile_name in all_profiles]
         
         for fixture_type, controls in self.fixture_type_controls.items():
             profile_combo = controls['profile_combo']
@@ -515,8 +539,9 @@ class GDTFMatchingDialog(QDialog):
             
             # Try to find a matching profile
             matched_profile = None
-            for profile_name in all_profiles.keys():
-                if fixture_type.lower() in profile_name.lower() or profile_name.lower() in fixture_type.lower():
+            fixture_type_lower = fixture_type.lower()
+            for profile_name, profile_name_lower in lowered_profiles:
+                if fixture_type_lower in profile_name_lower or profile_name_lower in fixture_type_lower:
                     matched_profile = profile_name
                     break
             
@@ -602,27 +627,32 @@ class GDTFMatchingDialog(QDialog):
         selected_attributes = self.get_selected_attributes()
         
         # Get all available profiles
-        all_profiles = {**self.gdtf_profiles, **self.external_profiles}
+        all_profiles = self._get_all_profiles()
+        
+        # Resolve each fixture type's profile and mode once, not per fixture
+        resolved_matches = {}
+        for fixture_type, match_info in matches.items():
+            profile_name = match_info['profile']
+            mode_name = match_info['mode']
+            profile = all_profiles.get(profile_name)
+            if profile and 'modes' in profile and mode_name in profile['modes']:
+                resolved_matches[fixture_type] = (profile_name, profile, mode_name)
         
         fixtures_updated = 0
         
         for fixture in self.fixtures:
-            fixture_type = fixture.get('type', 'Unknown')
+            resolved = resolved_matches.get(fixture.get('type', 'Unknown'))
             
-            if fixture_type in matches:
-                match_info = matches[fixture_type]
-                profile_name = match_info['profile']
-                mode_name = match_info['mode']
+            if resolved is not None:
+                profile_name, profile, mode_name = resolved
                 
                 # Apply profile and mode to fixture
-                profile = all_profiles.get(profile_name)
-                if profile and 'modes' in profile and mode_name in profile['modes']:
-                    fixture['gdtf_profile_name'] = profile_name
-                    fixture['gdtf_profile'] = profile
-                    fixture['mode'] = mode_name
-                    fixture['matched'] = True
-                    fixture['selected_attributes'] = selected_attributes
-                    fixtures_updated += 1
+                fixture['gdtf_profile_name'] = profile_name
+                fixture['gdtf_profile'] = profile
+                fixture['mode'] = mode_name
+                fixture['matched'] = True
+                fixture['selected_attributes'] = selected_attributes
+                fixtures_updated += 1
         
         self.status_text.append(f"Applied matches to {fixtures_updated} fixture(s)")
         return fixtures_updated 
\ No newline at end of file
@@ -356,11 +356,9 @@ class MA3ImportDialog(QDialog):
     
     def _update_import_button(self):
         """Update import button state based on selection."""
-        selected_count = 0
-        for row in range(self.fixtures_table.rowCount()):
-            checkbox = self.fixtures_table.cellWidget(row, 0)
-            if checkbox and checkbox.isChecked():
-                selected_count += 1
+        # Count the selection flags kept in sync by _checkbox_changed instead of
+        # querying every row's checkbox widget on each toggle
+        selected_count = sum(map(core.is_fixture_selected, self.fixtures))
         
         self.import_button.setEnabled(selected_count > 0)
         self.import_button.setText(f"Import Selected ({selected_count})")
@@ -368,6 +366,7 @@ class MA3ImportDialog(QDialog):
     def _import_fixtures(self):
         """Import selected fixtures."""
         selected_fixtures = []
+        none_role_names = []  # collected in the same pass for the role warning
         
         for row in range(self.fixtures_table.rowCount()):
             checkbox = self.fixtures_table.cellWidget(row, 0)
@@ -375,14 +374,15 @@ class MA3ImportDialog(QDialog):
                 fixture = self.fixtures[row]
                 core.set_fixture_selected(fixture, True)
                 selected_fixtures.append(fixture)
+                if core.get_fixture_role(fixture) == 'none':
+                    none_role_names.append(fixture.get('name', 'Unknown'))
             else:
                 core.set_fixture_selected(self.fixtures[row], False)
         
         if selected_fixtures:
             # Check if any fixtures have 'none' role and show warning
-            fixtures_with_none_role = [f for f in selected_fixtures if core.get_fixture_role(f) == 'none']
-            if fixtures_with_none_role:
-                fixture_names = [f.get('name', 'Unknown') for f in fixtures_with_none_role]
+            if none_role_names:
+                fixture_names = none_role_names
                 warning_msg = f"The following fixtures have NONE role and will be imported but may not appear in the main window tables:\n\n"
                 warning_msg += "\n".join(f"• {name}" for name in fixture_names[:10])  # Show first 10
                 if len(fixture_names) > 10:
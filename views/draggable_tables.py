@@ -251,12 +251,8 @@ class DraggableTableView(QTableView):
     
     def get_selected_rows(self):
         """Get a sorted list of currently selected row indices."""
-        selected_rows = []
-        for index in self.selectedIndexes():
-            row = index.row()
-            if row not in selected_rows:
-                selected_rows.append(row)
-        return sorted(selected_rows)
+        # Row selection yields one index per cell, so dedupe through a set
+        return sorted({index.row() for index in self.selectedIndexes()})
     
     def get_selection_info(self):
         """Get information about the current selection."""
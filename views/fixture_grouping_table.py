@@ -29,6 +29,7 @@ class FixtureGroupingTable(DraggableTableWidget):
         self._grouped_data = []  # List of grouped attribute rows
         self._fixture_groups = {}  # Maps fixture_id to list of row indices
         self._row_to_fixture = {}  # Maps row index to fixture_id
+        self._fixtures_by_id = {}  # Maps fixture_id to fixture dictionary
         
         # Callback for when data changes
         self._on_data_changed_callback = None
@@ -68,11 +69,14 @@ class FixtureGroupingTable(DraggableTableWidget):
         self._grouped_data = []
         self._fixture_groups = {}
         self._row_to_fixture = {}
+        self._fixtures_by_id = {}
         
         # Group fixtures by their attributes
         current_row = 0
         
         for fixture in self._fixtures:
+            # Keep the first fixture per id, matching what a linear search would find
+            self._fixtures_by_id.setdefault(fixture.get('fixture_id'), fixture)
             fixture_id = fixture.get('fixture_id', 0)
             fixture_rows = []
             
@@ -96,21 +100,31 @@ class FixtureGroupingTable(DraggableTableWidget):
                     # Fallback to unsorted attributes if no profile model
                     selected_attributes = list(fixture.get('attributes', {}).keys())
                 
+                # Look up per-fixture maps once rather than per attribute row
+                attributes = fixture.get('attributes', {})
+                sequences = fixture.get('sequences', {})
+                activation_groups = fixture.get('activation_groups', {})
+                addresses = fixture.get('addresses', {})
+                universes = fixture.get('universes', {})
+                channels = fixture.get('channels', {})
+                fixture_id_text = str(fixture_id)
+                fixture_name = fixture.get('name', '')
+                
                 # Add each attribute as a separate row
                 for attr_name in selected_attributes:
-                    if attr_name in fixture.get('attributes', {}):
+                    if attr_name in attributes:
                         # Get attribute details
-                        sequence_num = fixture.get('sequences', {}).get(attr_name, '—')
-                        activation_group = fixture.get('activation_groups', {}).get(attr_name, '—')
+                        sequence_num = sequences.get(attr_name, '—')
+                        activation_group = activation_groups.get(attr_name, '—')
                         
                         # Get address info - use calculated values from GDTF matching
-                        absolute_address = fixture.get('addresses', {}).get(attr_name, '?')
-                        universe = fixture.get('universes', {}).get(attr_name, '?')
-                        channel = fixture.get('channels', {}).get(attr_name, '?')
+                        absolute_address = addresses.get(attr_name, '?')
+                        universe = universes.get(attr_name, '?')
+                        channel = channels.get(attr_name, '?')
                         
                         row_data = {
-                            'Fixture ID': str(fixture_id),
-                            'Fixture Name': fixture.get('name', ''),
+                            'Fixture ID': fixture_id_text,
+                            'Fixture Name': fixture_name,
                             'Fixture Type': fixture_type,
                             'Attribute': attr_name,
                             'Sequence': str(sequence_num),
@@ -203,14 +217,9 @@ class FixtureGroupingTable(DraggableTableWidget):
     def _update_fixture_order(self):
         """Update fixture order based on current table order."""
         # Get the current order of fixtures from the table
-        fixture_order = []
-        seen_fixtures = set()
-        
-        for row in range(self.model().rowCount()):
-            fixture_id = self._row_to_fixture.get(row)
-            if fixture_id is not None and fixture_id not in seen_fixtures:
-                fixture_order.append(fixture_id)
-                seen_fixtures.add(fixture_id)
+        # dict keys keep first-seen order, so one walk both dedupes and orders
+        row_fixture_ids = (self._row_to_fixture.get(row) for row in range(self.model().rowCount()))
+        fixture_order = list(dict.fromkeys(fid for fid in row_fixture_ids if fid is not None))
         
         # Emit the fixture order changed signal
         self.fixtureOrderChanged.emit(fixture_order)
@@ -234,7 +243,7 @@ class FixtureGroupingTable(DraggableTableWidget):
                 fixture_rows = self._fixture_groups.get(fixture_id, [])
                 expanded_selection.update(fixture_rows)
         
-        return sorted(list(expanded_selection))
+        return sorted(expanded_selection)
     
     def startDrag(self, supportedActions):
         """Override to ensure fixture-level grouping during drag operations."""
@@ -267,11 +276,8 @@ class FixtureGroupingTable(DraggableTableWidget):
         # Create text for the pixmap
         if len(fixture_ids) == 1:
             fixture_id = list(fixture_ids)[0]
-            fixture_name = ""
-            for fixture in self._fixtures:
-                if fixture.get('fixture_id') == fixture_id:
-                    fixture_name = fixture.get('name', f'Fixture {fixture_id}')
-                    break
+            fixture = self._fixtures_by_id.get(fixture_id)
+            fixture_name = fixture.get('name', f'Fixture {fixture_id}') if fixture else ""
             text = f"Moving fixture: {fixture_name}"
         else:
             text = f"Moving {len(fixture_ids)} fixtures ({len(selected_rows)} rows)"
@@ -332,9 +338,7 @@ class FixtureGroupingTable(DraggableTableWidget):
                 expanded_selection = set()
                 
                 # Get all currently selected rows (including existing selection)
-                current_selection = set()
-                for index in self.selectedIndexes():
-                    current_selection.add(index.row())
+                current_selection = {index.row() for index in self.selectedIndexes()}
                 
                 # Expand each selected row to include all fixture rows
                 for row in current_selection:
@@ -412,11 +416,8 @@ class FixtureGroupingTable(DraggableTableWidget):
         
         if len(fixture_ids) == 1:
             fixture_id = list(fixture_ids)[0]
-            fixture_name = ""
-            for fixture in self._fixtures:
-                if fixture.get('fixture_id') == fixture_id:
-                    fixture_name = fixture.get('name', f'Fixture {fixture_id}')
-                    break
+            fixture = self._fixtures_by_id.get(fixture_id)
+            fixture_name = fixture.get('name', f'Fixture {fixture_id}') if fixture else ""
             return f"Selected fixture: {fixture_name} ({len(selected_rows)} rows)"
         else:
             return f"Selected {len(fixture_ids)} fixtures ({len(selected_rows)} rows)"
@@ -475,10 +476,7 @@ class FixtureGroupingTable(DraggableTableWidget):
     def getFixtureAtRow(self, row: int) -> Optional[Dict[str, Any]]:
         """Get the fixture data for a specific row."""
         if row in self._row_to_fixture:
-            fixture_id = self._row_to_fixture[row]
-            for fixture in self._fixtures:
-                if fixture.get('fixture_id') == fixture_id:
-                    return fixture
+            return self._fixtures_by_id.get(self._row_to_fixture[row])
         return None
     
     def getAttributeAtRow(self, row: int) -> Optional[str]: